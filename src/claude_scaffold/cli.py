@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 import argparse
+import atexit
+import os
 import sys
 from pathlib import Path
 
@@ -20,6 +22,33 @@ def print_banner():
     print(banner)
 
 
+def _buffer_stdout(buffer_size: int = 65536):
+    """Switch stdout to a block-buffered stream with a larger buffer.
+
+    Only for commands that never prompt: the interactive UI writes straight
+    to the terminal and needs stdout flushed line by line. A terminal stdout
+    is left line buffered too, so its output keeps its order relative to the
+    unbuffered stderr.
+    """
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        # Not backed by a file descriptor (e.g. captured output); leave it be
+        return
+    if os.isatty(fd):
+        return
+    sys.stdout.flush()
+    sys.stdout = open(
+        fd,
+        "w",
+        buffering=buffer_size,
+        encoding=sys.stdout.encoding,
+        errors=sys.stdout.errors,
+        closefd=False,
+    )
+    atexit.register(sys.stdout.flush)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Claude Scaffold - Generate self-documenting Claude code project skeletons",
@@ -109,6 +138,10 @@ Project Types:
 
     args = parser.parse_args()
 
+    # Only "new" is interactive; everything else can buffer its output
+    if args.command != "new":
+        _buffer_stdout()
+
     # Initialize logger with debug mode if requested
     logger = get_logger(debug_mode=args.debug)
     if args.log_file:
@@ -155,6 +188,8 @@ Project Types:
         print(f"\n\n{icons.ERROR} Operation cancelled by user.")
         sys.exit(1)
     except Exception as e:
+        # stdout may be block buffered; keep earlier output ahead of the error
+        sys.stdout.flush()
         print(f"\n{icons.ERROR} Unexpected error: {e}", file=sys.stderr)
         sys.exit(1)
 
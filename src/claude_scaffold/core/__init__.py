@@ -1,7 +1,21 @@
 """Core scaffolding functionality."""
 
-from .documentation_generator import DocumentationGenerator
-from .project_creator import ProjectCreator
-from .task_manager import TaskManager
+from importlib import import_module
 
 __all__ = ["ProjectCreator", "TaskManager", "DocumentationGenerator"]
+
+# The components import very different dependencies (rich, questionary, ...),
+# so each is only imported when first accessed (PEP 562)
+_SUBMODULES = {
+    "DocumentationGenerator": ".documentation_generator",
+    "ProjectCreator": ".project_creator",
+    "TaskManager": ".task_manager",
+}
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        value = getattr(import_module(_SUBMODULES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
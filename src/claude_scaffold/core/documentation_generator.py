@@ -1,12 +1,24 @@
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from ..templates.templates import ProjectTemplates
 from ..utils.formatters import Formatters
 from ..utils.icons import icons
 from ..utils.project_helpers import ProjectHelpers
 
+# Default TODO subtasks for a task without Claude-provided subtasks, in order
+DEFAULT_SUBTASK_VERBS = (
+    "Research",
+    "Document findings for",
+    "Write failing tests for",
+    "Implement",
+    "Verify all tests pass for",
+    "Update documentation for",
+)
+
 
 class DocumentationGenerator:
     """Handles all documentation generation for the project."""
@@ -15,52 +27,92 @@ class DocumentationGenerator:
         self.templates = ProjectTemplates()
         self.formatters = Formatters()
         self.helpers = ProjectHelpers()
+        # The research template only uses keys every research context provides,
+        # so it is filled straight from the context mapping
+        self._format_research = self.templates.workflow_templates["research_template"].format_map
 
     def generate_documentation(self, project_path: Path, project_data: Dict[str, Any]):
         """Generate all documentation files."""
         # Prepare context for templates
         context = self.helpers.prepare_template_context(project_data)
 
+        # Files are rendered first and written together at the end
+        writes = []
+
         # Generate root CLAUDE.md
         root_claude = self.templates.get_template("root_claude", context)
-        (project_path / "CLAUDE.md").write_text(root_claude)
+        writes.append((project_path / "CLAUDE.md", root_claude))
 
         # Generate GLOBAL_RULES.md
         global_rules = self.templates.get_template("global_rules", context)
-        (project_path / "GLOBAL_RULES.md").write_text(global_rules)
+        writes.append((project_path / "GLOBAL_RULES.md", global_rules))
 
         # Generate TASKS.md
         tasks_md = self.templates.get_template("tasks_md", context)
-        (project_path / "TASKS.md").write_text(tasks_md)
+        writes.append((project_path / "TASKS.md", tasks_md))
 
         # Generate root TODO.md
         root_todos = []
         for module in project_data.get("modules", []):
             root_todos.append(f"- [ ] Complete all tasks in {module['name']} module")
 
-        self.create_todo_file(
-            project_path / "TODO.md",
-            project_data["project_name"],
-            "the entire project",
-            root_todos,
+        writes.append(
+            (
+                project_path / "TODO.md",
+                self._render_todo_file(
+                    project_data["project_name"], "the entire project", root_todos
+                ),
+            )
         )
 
         # Generate module documentation
         module_tasks = self.formatters.organize_tasks_by_module(project_data["tasks"])
 
-        for module in project_data.get("modules", []):
+        # Context shared by every module; only the module-specific keys are
+        # layered on top of it below. The helpers need project metadata, so
+        # skip them entirely when there are no modules to document.
+        modules = project_data.get("modules", [])
+        if modules:
+            error_handling = self.helpers.get_error_handling(project_data)
+            shared_module_context = {
+                "public_api": "To be defined during implementation",
+                "internal_architecture": "To be defined during implementation",
+                "naming_conventions": self.helpers.get_naming_conventions(project_data),
+                "error_handling": error_handling,
+                "testing_strategy": self.helpers.get_testing_strategy(project_data),
+                "performance_notes": "To be defined based on requirements",
+                "security_notes": "To be defined based on requirements",
+                "example_imports": "specific_function, SpecificClass",
+                "usage_example": "# Actual usage examples will be added during implementation",
+            }
+
+        # Research template defaults; each task only overrides what it knows
+        shared_research_context = {
+            "key_questions": "- What are the requirements?\n- What are the constraints?\n- What are the edge cases?\n- What patterns should we follow?",
+            "findings": "To be completed during research phase",
+            "recommendations": "To be completed during research phase",
+            "references": "To be added during research",
+            "next_steps": "1. Complete research\n2. Write tests\n3. Implement solution",
+        }
+
+        for module in modules:
             module_path = project_path / module["name"]
 
             # Prepare module-specific context
-            module_context = context.copy()
+            module_specific = {
+                "module_name": module["name"],
+                "module_description": module["description"],
+                "file_organization": self.helpers.get_file_organization(module, project_data),
+                "module_tasks": self.formatters.format_module_tasks(
+                    module["name"], module_tasks.get(module["name"], [])
+                ),
+            }
 
             # Use Claude-enhanced documentation if available
             if "documentation" in module:
                 claude_docs = module["documentation"]
-                module_context.update(
+                module_specific.update(
                     {
-                        "module_name": module["name"],
-                        "module_description": module["description"],
                         "module_responsibilities": claude_docs.get(
                             "responsibilities",
                             self.helpers.get_module_responsibilities(module, project_data),
@@ -74,59 +126,32 @@ class DocumentationGenerator:
                         "dependencies": self.formatters.format_dependencies(
                             claude_docs.get("dependencies", [])
                         ),
-                        "naming_conventions": self.helpers.get_naming_conventions(project_data),
-                        "file_organization": self.helpers.get_file_organization(
-                            module, project_data
-                        ),
-                        "error_handling": claude_docs.get(
-                            "error_handling",
-                            self.helpers.get_error_handling(project_data),
-                        ),
-                        "module_tasks": self.formatters.format_module_tasks(
-                            module["name"], module_tasks.get(module["name"], [])
-                        ),
-                        "testing_strategy": self.helpers.get_testing_strategy(project_data),
+                        "error_handling": claude_docs.get("error_handling", error_handling),
                         "performance_notes": claude_docs.get(
                             "performance", "To be defined based on requirements"
                         ),
                         "security_notes": claude_docs.get(
                             "security", "To be defined based on requirements"
                         ),
-                        "example_imports": "specific_function, SpecificClass",
                         "usage_example": self.formatters.format_examples(
                             claude_docs.get("examples", [])
                         ),
                     }
                 )
             else:
-                module_context.update(
+                module_specific.update(
                     {
-                        "module_name": module["name"],
-                        "module_description": module["description"],
                         "module_responsibilities": self.helpers.get_module_responsibilities(
                             module, project_data
                         ),
-                        "public_api": "To be defined during implementation",
-                        "internal_architecture": "To be defined during implementation",
                         "dependencies": self.helpers.get_module_dependencies(module, project_data),
-                        "naming_conventions": self.helpers.get_naming_conventions(project_data),
-                        "file_organization": self.helpers.get_file_organization(
-                            module, project_data
-                        ),
-                        "error_handling": self.helpers.get_error_handling(project_data),
-                        "module_tasks": self.formatters.format_module_tasks(
-                            module["name"], module_tasks.get(module["name"], [])
-                        ),
-                        "testing_strategy": self.helpers.get_testing_strategy(project_data),
-                        "performance_notes": "To be defined based on requirements",
-                        "security_notes": "To be defined based on requirements",
-                        "example_imports": "specific_function, SpecificClass",
-                        "usage_example": "# Actual usage examples will be added during implementation",
                     }
                 )
 
+            module_context = ChainMap(module_specific, shared_module_context, context)
+
             module_claude = self.templates.get_template("module_claude", module_context)
-            (module_path / "CLAUDE.md").write_text(module_claude)
+            writes.append((module_path / "CLAUDE.md", module_claude))
 
             # Create module TODO.md
             module_todos = []
@@ -139,22 +164,18 @@ class DocumentationGenerator:
                             module_todos.append(f"- [ ] {subtask}")
                     else:
                         # Use default subtasks
+                        title = task["title"]
                         module_todos.extend(
-                            [
-                                f"- [ ] Research: {task['title']}",
-                                f"- [ ] Document findings for: {task['title']}",
-                                f"- [ ] Write failing tests for: {task['title']}",
-                                f"- [ ] Implement: {task['title']}",
-                                f"- [ ] Verify all tests pass for: {task['title']}",
-                                f"- [ ] Update documentation for: {task['title']}",
-                            ]
+                            [f"- [ ] {verb}: {title}" for verb in DEFAULT_SUBTASK_VERBS]
                         )
 
-            self.create_todo_file(
-                module_path / "TODO.md",
-                module["name"],
-                f"the {module['name']} module",
-                module_todos,
+            writes.append(
+                (
+                    module_path / "TODO.md",
+                    self._render_todo_file(
+                        module["name"], f"the {module['name']} module", module_todos
+                    ),
+                )
             )
 
             # Create research templates for tasks
@@ -167,45 +188,44 @@ class DocumentationGenerator:
                     # Use Claude-enhanced details if available
                     if "details" in task:
                         details = task["details"]
-                        research_topics = details.get("research_topics", [])
-                        research_questions = (
-                            "\n".join([f"- {topic}" for topic in research_topics])
-                            if research_topics
-                            else "- What are the requirements?\n- What are the constraints?\n- What are the edge cases?\n- What patterns should we follow?"
-                        )
-
-                        research_context = {
+                        research_topics = details.get("research_topics", ())
+                        research_specific = {
                             "task_name": task["title"],
                             "research_objective": details.get(
                                 "goal",
                                 f"Research and document approach for: {task['title']}",
                             ),
-                            "key_questions": research_questions,
-                            "findings": "To be completed during research phase",
-                            "recommendations": "To be completed during research phase",
-                            "references": "To be added during research",
-                            "next_steps": "1. Complete research\n2. Write tests\n3. Implement solution",
                         }
+                        if research_topics:
+                            research_specific["key_questions"] = "\n".join(
+                                [f"- {topic}" for topic in research_topics]
+                            )
                     else:
-                        research_context = {
+                        research_specific = {
                             "task_name": task["title"],
                             "research_objective": f"Research and document approach for: {task['title']}",
-                            "key_questions": "- What are the requirements?\n- What are the constraints?\n- What are the edge cases?\n- What patterns should we follow?",
-                            "findings": "To be completed during research phase",
-                            "recommendations": "To be completed during research phase",
-                            "references": "To be added during research",
-                            "next_steps": "1. Complete research\n2. Write tests\n3. Implement solution",
                         }
 
-                    research_content = self.templates.get_template(
-                        "research_template", research_context
-                    )
-                    research_file.write_text(research_content)
+                    research_context = ChainMap(research_specific, shared_research_context)
+                    research_content = self._format_research(research_context)
+                    writes.append((research_file, research_content))
+
+        self._write_files(writes)
+
+    def _write_files(self, writes: List[Tuple[Path, str]]):
+        """Write rendered files, overlapping the filesystem calls in a thread pool."""
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            # Consume the results so a failed write is raised here
+            list(executor.map(lambda item: item[0].write_text(item[1]), writes))
 
     def create_todo_file(
         self, file_path: Path, scope: str, scope_description: str, todo_items: List[str]
     ):
         """Create a TODO.md file with enhanced formatting."""
+        file_path.write_text(self._render_todo_file(scope, scope_description, todo_items))
+
+    def _render_todo_file(self, scope: str, scope_description: str, todo_items: List[str]) -> str:
+        """Render the TODO.md content for a scope."""
         total = len(todo_items)
         completed = sum(1 for item in todo_items if "[x]" in item.lower())
         pending = total - completed
@@ -232,5 +252,4 @@ class DocumentationGenerator:
             "timestamp": datetime.now().isoformat(),
         }
 
-        content = self.templates.get_template("todo_md", context)
-        file_path.write_text(content)
+        return self.templates.get_template("todo_md", context)
@@ -1,6 +1,20 @@
 """Interactive setup modules."""
 
-from .interactive_collectors import InteractiveCollectors
-from .interactive_setup import InteractiveSetup
+from importlib import import_module
 
 __all__ = ["InteractiveSetup", "InteractiveCollectors"]
+
+# Imported on first access (PEP 562) so that loading one interactive module
+# doesn't pull in the prompt and UI stack of all the others
+_SUBMODULES = {
+    "InteractiveCollectors": ".interactive_collectors",
+    "InteractiveSetup": ".interactive_setup",
+}
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        value = getattr(import_module(_SUBMODULES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,11 @@
 """Enhanced interactive setup with improved UI and discovery system."""
 
+import json
+import os
+import tempfile
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional, Set
 
 import yaml
 
@@ -10,6 +13,20 @@ from ..claude.claude_processor import ClaudeProcessor
 from ..utils.progress import progress_indicator
 from ..utils.terminal_ui import EnhancedTerminalUI
 
+# libyaml's C parser when PyYAML was built with it, the pure-Python one otherwise
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Defaults for each config section; user config files override per key
+_DEFAULT_CONFIG = {
+    "discovery": {"max_questions": 100, "enable_deep_discovery": True},
+    "claude": {"timeout_seconds": 300, "max_retries": 3, "chunk_size": 3},
+    "ui": {
+        "show_progress_bars": True,
+        "fixed_input_box": True,
+        "message_boxes": True,
+    },
+}
+
 
 class EnhancedInteractiveSetup:
     """Enhanced interactive setup with deep discovery system."""
@@ -19,30 +36,64 @@ class EnhancedInteractiveSetup:
         self.claude_processor = ClaudeProcessor()
         self.config = self._load_config(config_file)
         self.discovery_responses = []
+        # Questions already in discovery_responses, for quick membership tests
+        self._asked_questions: Set[str] = set()
         self.project_context = {}
 
     def _load_config(self, config_file: Optional[str]) -> Dict[str, Any]:
         """Load configuration from file or use defaults."""
-        default_config = {
-            "discovery": {"max_questions": 100, "enable_deep_discovery": True},
-            "claude": {"timeout_seconds": 300, "max_retries": 3, "chunk_size": 3},
-            "ui": {
-                "show_progress_bars": True,
-                "fixed_input_box": True,
-                "message_boxes": True,
-            },
-        }
+        # Copying the sections is enough: all the default values are immutable
+        default_config = {key: dict(section) for key, section in _DEFAULT_CONFIG.items()}
 
         if config_file and Path(config_file).exists():
-            with open(config_file, "r") as f:
-                user_config = yaml.safe_load(f)
-                # Merge with defaults
-                for key in default_config:
-                    if key in user_config:
-                        default_config[key].update(user_config[key])
+            user_config = self._read_config_file(Path(config_file))
+            # Merge with defaults
+            for key in default_config:
+                if key in user_config:
+                    default_config[key].update(user_config[key])
 
         return default_config
 
+    def _read_config_file(self, config_path: Path) -> Any:
+        """Parse a YAML config file, going through a JSON cache next to it.
+
+        The cache records the YAML file's mtime and size when it was parsed
+        and is used only while both still match exactly; otherwise the YAML
+        is parsed and the cache rewritten.
+        """
+        cache_path = config_path.with_name(config_path.name + ".cache.json")
+        stat = config_path.stat()
+        try:
+            with open(cache_path, "rb") as f:
+                cache = json.load(f)
+            if cache["mtime_ns"] == stat.st_mtime_ns and cache["size"] == stat.st_size:
+                return cache["config"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # No usable cache; parse the YAML
+
+        # Bytes go straight to the parser, which detects the encoding
+        with open(config_path, "rb") as f:
+            user_config = yaml.load(f, Loader=_YamlLoader)
+
+        # Only cache what JSON reproduces exactly (no dates, non-string keys, ...)
+        try:
+            cached = json.dumps(
+                {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "config": user_config}
+            )
+            if json.loads(cached)["config"] == user_config:
+                fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "w") as f:
+                        f.write(cached)
+                    os.replace(tmp_path, cache_path)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+        except (OSError, TypeError, ValueError):
+            pass  # Caching is best effort
+
+        return user_config
+
     def run(self) -> Dict[str, Any]:
         """Run the enhanced interactive setup."""
         self.ui.clear_screen()
@@ -165,12 +216,10 @@ class EnhancedInteractiveSetup:
             # Generate next question based on context
             category = categories[current_category_index % len(categories)]
 
-            with progress_indicator.claude_thinking(
+            with self.ui.external_output(), progress_indicator.claude_thinking(
                 f"Generating {category.replace('_', ' ')} question"
             ):
-                question = self._generate_contextual_question(
-                    project_info, self.discovery_responses, category
-                )
+                question = self._generate_contextual_question(project_info, category)
 
             if question:
                 # Ask the question
@@ -185,6 +234,7 @@ class EnhancedInteractiveSetup:
                 self.discovery_responses.append(
                     {"category": category, "question": question, "answer": answer}
                 )
+                self._asked_questions.add(question)
 
                 question_count += 1
                 current_category_index += 1
@@ -199,9 +249,7 @@ class EnhancedInteractiveSetup:
             f"Discovery phase complete! Collected {len(self.discovery_responses)} responses."
         )
 
-    def _generate_contextual_question(
-        self, project_info: Dict, responses: List[Dict], category: str
-    ) -> Optional[str]:
+    def _generate_contextual_question(self, project_info: Dict, category: str) -> Optional[str]:
         """Generate a contextual question based on previous responses."""
         # This is a simplified version - in production, this would call Claude
         # to generate intelligent questions based on the context
@@ -268,14 +316,8 @@ class EnhancedInteractiveSetup:
         # Get questions for the category
         category_questions = question_templates.get(category, [])
 
-        # Filter out already asked questions
-        asked_questions = [r["question"] for r in responses]
-        available_questions = [q for q in category_questions if q not in asked_questions]
-
-        if available_questions:
-            return available_questions[0]
-
-        return None
+        # First question that hasn't been asked yet
+        return next((q for q in category_questions if q not in self._asked_questions), None)
 
     def _generate_enhanced_project(self, project_info: Dict[str, Any]) -> Dict[str, Any]:
         """Generate enhanced project structure using Claude."""
@@ -411,7 +453,9 @@ class EnhancedInteractiveSetup:
 
     def _create_project(self, project_data: Dict[str, Any]):
         """Create the actual project structure."""
-        with progress_indicator.operation("Creating project", total=5) as progress:
+        with self.ui.external_output(), progress_indicator.operation(
+            "Creating project", total=5
+        ) as progress:
             progress.update(description="Creating directory structure...")
             time.sleep(0.5)
 
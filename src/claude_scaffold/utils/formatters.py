@@ -1,3 +1,4 @@
+from collections import defaultdict
 from typing import Any, Dict, List
 
 from .icons import icons
@@ -8,13 +9,11 @@ class Formatters:
 
     def organize_tasks_by_module(self, tasks: List[Dict]) -> Dict[str, List[Dict]]:
         """Organize tasks by their assigned module."""
-        module_tasks = {}
+        module_tasks = defaultdict(list)
         for task in tasks:
-            module = task["module"]
-            if module not in module_tasks:
-                module_tasks[module] = []
-            module_tasks[module].append(task)
-        return module_tasks
+            module_tasks[task["module"]].append(task)
+        # Plain dict so lookups of unknown modules don't add empty entries
+        return dict(module_tasks)
 
     def format_module_tasks(self, module_name: str, tasks: List[Dict]) -> str:
         """Format tasks for a specific module."""
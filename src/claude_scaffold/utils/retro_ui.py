@@ -1,12 +1,20 @@
 """Retro full-screen UI with Anthropic black and orange theme."""
 
+import atexit
+import bisect
 import os
 import shutil
-from typing import Any, Dict, List, Optional, Tuple
-from datetime import datetime
+import sys
+import termios
+import textwrap
+import threading
+import time
+import tty
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import questionary
-from questionary import Style as QStyle
 from rich.console import Console, Group
 from rich.layout import Layout
 from rich.panel import Panel
@@ -17,6 +25,9 @@ from rich.table import Table
 from rich.columns import Columns
 from rich.padding import Padding
 from rich.live import Live
+from rich.segment import SegmentLines
+from rich.style import Style
+from rich.styled import Styled
 
 from .icons import icons
 from .logger import get_logger
@@ -51,15 +62,305 @@ class RetroTheme:
     # Retro CRT effect colors
     SCANLINE = "#111111"
     GLOW = ORANGE_DARK
+    
+    # Precomputed Style objects, so redraws neither format nor parse them
+    BOLD_ORANGE = Style(color=ORANGE, bold=True)
+    BOLD_ORANGE_LIGHT = Style(color=ORANGE_LIGHT, bold=True)
+    BOLD_ORANGE_DARK = Style(color=ORANGE_DARK, bold=True)
+    BOLD_WHITE = Style(color=WHITE, bold=True)
+    BOLD_GREEN = Style(color=GREEN, bold=True)
+    ON_BACKGROUND = Style(bgcolor=BACKGROUND)
+    ON_SCANLINE = Style(bgcolor=SCANLINE)
+    TEXT_DIM_ITALIC = Style(color=TEXT_DIM, italic=True)
+    TEXT_ON_DARK_GRAY = Style(color=TEXT, bgcolor=DARK_GRAY)
+
+
+# Raw terminal file descriptors used by the key loops
+STDIN_FD = 0
+STDOUT_FD = 1
+
+
+@lru_cache(maxsize=64)
+def _panel_title(label: str) -> Text:
+    """Build a styled panel title once and reuse it for the life of the process."""
+    return Text(label, style=RetroTheme.ORANGE)
+
+
+@lru_cache(maxsize=128)
+def _wrap_question(question: str, width: int) -> str:
+    """Wrap a Q&A question once; re-asked questions reuse the result."""
+    return textwrap.fill(question, width=width)
+
+
+def _read_bytes(n: int = 8) -> bytes:
+    """Read up to ``n`` raw bytes from stdin, bypassing the text IO layer.
+
+    A read returns whatever has arrived: it may hold several keys (a held
+    arrow, an arrow then Enter) or end partway through an escape sequence,
+    so callers walk the whole buffer with ``_key_length``.
+    """
+    # stdout may be block buffered, so make sure the last frame is on screen
+    sys.stdout.flush()
+    return os.read(STDIN_FD, n)
+
+
+def _key_length(buf: bytes, i: int = 0) -> int:
+    """Return the length of the key starting at ``buf[i]``.
+
+    A read can hold several keys, so loops walk the buffer with this one key
+    at a time. CSI sequences (``ESC [`` ... final byte) count as one key; an
+    ESC with nothing after it is a bare Escape. Returns 0 when an escape
+    sequence is cut off at the end of ``buf`` and needs the next read.
+    """
+    if buf[i] != 0x1b or i + 1 == len(buf) or buf[i + 1] != 0x5b:
+        return 1
+    # CSI: parameters up to a final byte in 0x40-0x7E
+    for end in range(i + 2, len(buf)):
+        if 0x40 <= buf[end] <= 0x7e:
+            return end + 1 - i
+    return 0
+
+
+def _set_raw(fd: int) -> None:
+    """Put ``fd`` in raw mode with reads that block for the first byte.
+    
+    VMIN=1 returns as soon as one byte is available, and VTIME=1 keeps the
+    read collecting bytes that follow within 0.1s, so an escape sequence
+    usually arrives in one ``_read_bytes`` call rather than one syscall per
+    byte. This is not guaranteed: a read can still split a sequence or
+    hold several keys.
+    """
+    tty.setraw(fd)
+    attrs = termios.tcgetattr(fd)
+    # Keep output post-processing so frames drawn while raw still get \r\n
+    attrs[1] |= termios.OPOST
+    attrs[6][termios.VMIN] = 1
+    attrs[6][termios.VTIME] = 1
+    termios.tcsetattr(fd, termios.TCSANOW, attrs)
+
+
+@contextmanager
+def _raw_mode(fd: int = STDIN_FD) -> Iterator[None]:
+    """Hold ``fd`` in raw mode for a whole key loop.
+
+    The saved attributes are restored once on exit with TCSANOW; nothing is
+    waiting to drain, so TCSADRAIN's wait is not needed.
+    """
+    old_settings = termios.tcgetattr(fd)
+    try:
+        _set_raw(fd)
+        yield
+    finally:
+        termios.tcsetattr(fd, termios.TCSANOW, old_settings)
+
+
+@contextmanager
+def _block_buffered_stdout() -> Iterator[None]:
+    """Turn off line buffering on ``sys.stdout`` for one redraw loop.
+
+    A tty stdout flushes on every newline written through it; inside the
+    block frames reach the tty only on an explicit flush. The original
+    setting is restored on exit, which also flushes.
+    """
+    line_buffering = getattr(sys.stdout, "line_buffering", False)
+    if line_buffering:
+        sys.stdout.reconfigure(line_buffering=False)
+    try:
+        yield
+    finally:
+        if line_buffering:
+            sys.stdout.reconfigure(line_buffering=line_buffering)
+
+
+# Clear screen and scrollback, home cursor
+_CLEAR_SCREEN = b'\033[2J\033[3J\033[H'
+_SHOW_CURSOR = b'\033[?25h'
+_HIDE_CURSOR = b'\033[?25l'
+_CURSOR_HOME = b'\033[H'
+# Show cursor, clear screen and scrollback, home cursor
+_RESTORE_TERMINAL = b'\033[?25h\033[2J\033[3J\033[H'
+# Raw SGR for the hand-drawn boxes: RetroTheme.ORANGE foreground, and reset
+_ORANGE_SGR = b'\033[38;2;218;119;86m'
+_RESET_SGR = b'\033[0m'
+
+
+def _first_line(text: str) -> str:
+    """Return the first line of ``text`` without splitting the whole string."""
+    nl = text.find('\n')
+    return text if nl == -1 else text[:nl]
+
+
+# Options offered by show_enhancement_options, numbered from 1
+_ENHANCE_OPTIONS = (
+    {
+        "num": "1",
+        "title": "CONTINUE AS IS",
+        "desc": "Use your original description\nwithout any modifications",
+        "hint": "Simple projects with clear requirements"
+    },
+    {
+        "num": "2", 
+        "title": "ENHANCE WITH CLAUDE",
+        "desc": "Let Claude analyze and improve\nyour project specification",
+        "hint": "Get professional structure & best practices"
+    },
+    {
+        "num": "3",
+        "title": "Q&A DEEP DIVE ✨",
+        "desc": "Interactive Q&A session with Claude\n(20-100 questions) for detailed planning",
+        "hint": "Complex projects needing detailed specs"
+    },
+)
+
+
+# Choice row markers for the selection picker
+_SELECTED_MARKER = Text("  ► ", style=RetroTheme.BOLD_ORANGE)
+_UNSELECTED_MARKER = Text("    ")
+
+
+# Raw key bursts understood by the selection picker
+_SELECTION_KEYS = {
+    b'\x1b[A': 'up',
+    b'\x1b[B': 'down',
+    b'\r': 'enter',
+    b'\n': 'enter',
+    b'\x1b': 'esc',
+    b'\x03': 'intr',
+}
+
+
+def _key_action(keymap: Dict[bytes, str], buf: bytes, i: int = 0) -> Tuple[Optional[str], int]:
+    """Look up the action for the key at ``buf[i]`` in a ``_read_bytes`` buffer.
+
+    Returns the action (None for unmapped keys, including unknown escape
+    sequences) and the number of bytes the key used, so callers can walk a
+    buffer holding several keys. The count is 0 when an escape sequence is
+    cut off at the end of ``buf``.
+    """
+    length = _key_length(buf, i)
+    return keymap.get(buf[i:i + length]), length
+
+
+def _write_stdout(data: bytes) -> None:
+    """Write ``data`` to the terminal with raw ``os.write`` calls."""
+    # Anything already queued on sys.stdout must reach the tty first
+    sys.stdout.flush()
+    view = memoryview(data)
+    while view:
+        view = view[os.write(STDOUT_FD, view):]
+
+
+class _InputBox:
+    """The hand-drawn Q&A answer box, redrawn row by row.
+    
+    Everything but the text rows is fixed for the box's lifetime and is
+    encoded once. Each row opens the border colour itself so it can be
+    redrawn alone, and ``render`` only emits the rows that differ from what
+    is already on screen (typing usually touches one).
+    """
+    
+    def __init__(self, top: int, left: int, width: int, max_height: int):
+        self.max_height = max_height
+        # What is currently on screen for each box row
+        self.painted: List[Optional[bytes]] = [None] * max_height
+        # Cursor moves to the start of each box row
+        self.moves = [f'\033[{top + i};{left}H'.encode() for i in range(max_height)]
+        self.top_row = _ORANGE_SGR + f"╭{'─' * width}╮".encode()
+        self.bottom_row = _ORANGE_SGR + f"╰{'─' * width}╯".encode()
+        self.empty_row = _ORANGE_SGR + f"│{' ' * width}│".encode()
+        self.empty_cursor_row = (
+            _ORANGE_SGR + "│ ".encode() + _RESET_SGR + f"█{' ' * (width - 3)}".encode()
+            + _ORANGE_SGR + " │".encode()
+        )
+        self.blank_row = b' ' * (width + 4)
+        self.text_open = _ORANGE_SGR + "│ ".encode() + _RESET_SGR
+        self.text_close = _ORANGE_SGR + " │".encode()
+        self.text_width = width - 2
+    
+    def render(
+        self,
+        wrapped_lines: List[str],
+        cursor_line: int,
+        cursor_col: int,
+        box_height: int,
+        visible_start: int
+    ) -> bytes:
+        """Return the bytes that bring the box on screen up to date."""
+        text_open, text_close, text_width = self.text_open, self.text_close, self.text_width
+        
+        # Build every row
+        # Top border
+        rows = [self.top_row]
+        
+        # Content lines
+        for line_idx in range(visible_start, visible_start + box_height - 2):
+            if line_idx < len(wrapped_lines):
+                line_text = wrapped_lines[line_idx]
+                # Show cursor on current line
+                if line_idx == cursor_line:
+                    if cursor_col < len(line_text):
+                        display_line = line_text[:cursor_col] + "█" + line_text[cursor_col:]
+                    else:
+                        display_line = line_text + "█"
+                else:
+                    display_line = line_text
+                
+                # Pad (or, should it ever overflow, cut) the line to the box
+                # width so the right border stays put
+                rows.append(text_open + display_line.ljust(text_width)[:text_width].encode() + text_close)
+            else:
+                # Empty line
+                rows.append(self.empty_cursor_row if line_idx == cursor_line else self.empty_row)
+        
+        # Bottom border
+        rows.append(self.bottom_row)
+        
+        # Clear any rows left over from a taller box
+        rows.extend([self.blank_row] * (self.max_height - box_height))
+        
+        # Save cursor position, rewrite the changed rows, reset the colour
+        # and restore the cursor
+        painted, moves = self.painted, self.moves
+        out = [b'\033[s']
+        for i, row in enumerate(rows):
+            if row != painted[i]:
+                out.append(moves[i])
+                out.append(row)
+                painted[i] = row
+        if len(out) == 1:
+            return b''
+        out.append(_RESET_SGR + b'\033[u')
+        return b''.join(out)
 
 
 class RetroUI:
     """Full-screen retro UI for Claude Scaffold."""
     
+    # Questionary style with retro theme (static, so built once at import)
+    qstyle = questionary.Style([
+        ("qmark", f"fg:{RetroTheme.ORANGE} bold"),
+        ("question", f"fg:{RetroTheme.WHITE} bold"),
+        ("answer", f"fg:{RetroTheme.ORANGE_LIGHT} bold"),
+        ("pointer", f"fg:{RetroTheme.ORANGE} bold"),
+        ("highlighted", f"fg:{RetroTheme.BLACK} bg:{RetroTheme.ORANGE}"),
+        ("selected", f"fg:{RetroTheme.ORANGE_LIGHT}"),
+        ("separator", f"fg:{RetroTheme.LIGHT_GRAY}"),
+        ("instruction", f"fg:{RetroTheme.LIGHT_GRAY}"),
+        ("text", f"fg:{RetroTheme.WHITE}"),
+        ("disabled", f"fg:{RetroTheme.GRAY}"),
+    ])
+    
     def __init__(self):
         self.width, self.height = self._get_terminal_size()
-        # Create console with reduced height to prevent scrolling
-        self.console = Console(height=self.height)
+        # Create console with reduced height to prevent scrolling. Every
+        # renderable is pre-styled Text, so markup, emoji and the automatic
+        # highlighter are pure overhead on each print.
+        self.console = Console(
+            height=self.height,
+            highlight=False,
+            markup=False,
+            emoji=False
+        )
         self.theme = RetroTheme()
         self.logger = get_logger()
         
@@ -68,32 +369,72 @@ class RetroUI:
             "terminal_size": f"{self.width}x{self.height}"
         })
         
-        # Questionary style with retro theme
-        self.qstyle = QStyle([
-            ("qmark", f"fg:{self.theme.ORANGE} bold"),
-            ("question", f"fg:{self.theme.WHITE} bold"),
-            ("answer", f"fg:{self.theme.ORANGE_LIGHT} bold"),
-            ("pointer", f"fg:{self.theme.ORANGE} bold"),
-            ("highlighted", f"fg:{self.theme.BLACK} bg:{self.theme.ORANGE}"),
-            ("selected", f"fg:{self.theme.ORANGE_LIGHT}"),
-            ("separator", f"fg:{self.theme.LIGHT_GRAY}"),
-            ("instruction", f"fg:{self.theme.LIGHT_GRAY}"),
-            ("text", f"fg:{self.theme.WHITE}"),
-            ("disabled", f"fg:{self.theme.GRAY}"),
-        ])
+        # Header renderables: the logo never changes and headers are keyed
+        # by (title, subtitle)
+        self._logo_renderable = self._build_logo()
+        self._header_cache: Dict[Tuple[str, str], Panel] = {}
+        
+        # Footers only change when the clock ticks over to a new second
+        self._footer_ts: Tuple[int, str] = (0, "")
+        self._footer_cache: Dict[str, Panel] = {}
+        
+        # Rendered Q&A screens around the input box, keyed by question. The
+        # header and footer Panels above are laid out when printed, but these
+        # are fixed-width bytes, so they are dropped when the width changes.
+        self._qa_frame_cache: Dict[Tuple[str, str, str, int, str, bool], bytes] = {}
+        self._qa_frame_width = 0
+        
+        # Static instruction lines, built once instead of on every frame
+        self._selection_instructions = self._build_instructions(
+            ("↑↓ ", "Navigate   "), ("ENTER ", "Select   "), ("ESC ", "Cancel")
+        )
+        self._enh_instructions = self._build_instructions(
+            ("↑↓ ", "Navigate   "), ("ENTER ", "Select   "), ("1-3 ", "Quick Select")
+        )
+        self._confirm_instructions = self._build_instructions(
+            ("← → ", "Navigate   "), ("ENTER ", "Confirm   "), ("Y/N ", "Quick Select")
+        )
+        
+        self._enh_note = Text()
+        self._enh_note.append("Note: ", style=self.theme.BOLD_ORANGE)
+        self._enh_note.append("Q&A mode allows you to press ", style=self.theme.TEXT_DIM)
+        self._enh_note.append("Ctrl+\\", style=self.theme.BOLD_ORANGE)
+        self._enh_note.append(" when you have enough information", style=self.theme.TEXT_DIM)
+        
+        # Unselected and selected renderings of each enhancement option,
+        # indexed by option number - 1
+        self._enh_options_unselected = tuple(
+            self._build_enhancement_option(opt, False) for opt in _ENHANCE_OPTIONS
+        )
+        self._enh_options_selected = tuple(
+            self._build_enhancement_option(opt, True) for opt in _ENHANCE_OPTIONS
+        )
+        
+        # Set by stop_progress() to end the animation thread
+        self._stop_event = threading.Event()
+        # Progress animation frames per second
+        self.refresh_rate = 10
+        self._stdout_isatty = sys.stdout.isatty()
+        
+        # Whether the cursor is currently shown, so show/hide sequences are
+        # only sent when it actually changes
+        self._cursor_visible = True
         
         # Register cleanup handler
-        import atexit
         atexit.register(self.cleanup)
     
     def cleanup(self):
         """Restore terminal state on exit."""
-        # Show cursor
-        print('\033[?25h', end='', flush=True)
-        # Clear screen
-        self._clear_screen()
-        # Restore cursor
-        print('\033[?25h', end='', flush=True)
+        _write_stdout(_RESTORE_TERMINAL)
+        self._cursor_visible = True
+        
+    def _build_instructions(self, *pairs: Tuple[str, str]) -> Text:
+        """Build a key/description instruction line."""
+        instructions = Text()
+        for key, description in pairs:
+            instructions.append(key, style=self.theme.BOLD_ORANGE)
+            instructions.append(description, style=self.theme.TEXT_DIM)
+        return instructions
         
     def _get_terminal_size(self) -> Tuple[int, int]:
         """Get terminal dimensions."""
@@ -103,64 +444,141 @@ class RetroUI:
         
     def _clear_screen(self):
         """Clear the terminal screen."""
-        os.system('clear' if os.name == 'posix' else 'cls')
-        # Hide cursor to prevent it from appearing below the box
-        print('\033[?25l', end='', flush=True)
+        # Hide the cursor (so it can't appear below the box), clear the screen
+        # and scrollback, and home the cursor in one write instead of
+        # spawning `clear`/`cls`
+        _write_stdout(self._cursor(False) + _CLEAR_SCREEN)
+    
+    def _cursor(self, visible: bool) -> bytes:
+        """Return the sequence that shows or hides the cursor.
         
-    def _create_header(self, title: str, subtitle: str = "") -> Panel:
-        """Create a retro header panel."""
-        header_lines = []
+        Empty if the cursor is already in that state, so back-to-back screens
+        don't keep toggling it.
+        """
+        if visible == self._cursor_visible:
+            return b""
+        self._cursor_visible = visible
+        return _SHOW_CURSOR if visible else _HIDE_CURSOR
+    
+    @contextmanager
+    def _rich_cursor(self) -> Iterator[None]:
+        """Wrap a Rich Live display, which hides the cursor and shows it again."""
+        try:
+            yield
+        finally:
+            self._cursor_visible = True
         
-        # ASCII art logo with glow effect
-        logo = Text()
-        logo.append("┌─┐┬  ┌─┐┬ ┬┌┬┐┌─┐  ┌─┐┌─┐┌─┐┌─┐┌─┐┌─┐┬  ┌┬┐\n", style=f"bold {self.theme.ORANGE}")
-        logo.append("│  │  ├─┤│ │ ││├┤   └─┐│  ├─┤├┤ ├┤ │ ││   ││\n", style=f"bold {self.theme.ORANGE_LIGHT}")
-        logo.append("└─┘┴─┘┴ ┴└─┘─┴┘└─┘  └─┘└─┘┴ ┴└  └  └─┘┴─┘─┴┘", style=f"bold {self.theme.ORANGE_DARK}")
+    def _print_frame(
+        self, renderable: Any, suffix: bytes = b"", prefix: bytes = b"", **print_kwargs: Any
+    ) -> None:
+        """Render a whole frame off-screen and emit it with a single write.
         
-        # Add scanline effect
-        logo_with_scanlines = Text()
-        for i, line in enumerate(str(logo).split('\n')):
+        ``prefix`` and ``suffix`` are raw terminal bytes (e.g. a cursor move
+        or toggle) sent in the same write, before and after the frame.
+        """
+        _write_stdout(prefix + self._render_frame(renderable, **print_kwargs) + suffix)
+    
+    def _render_frame(self, renderable: Any, **print_kwargs: Any) -> bytes:
+        """Render a whole frame off-screen to the bytes _print_frame writes."""
+        print_kwargs.setdefault("style", self.theme.ON_BACKGROUND)
+        with self.console.capture() as capture:
+            self.console.print(renderable, **print_kwargs)
+        return capture.get().encode()
+        
+    def _build_logo(self) -> Align:
+        """Build the centered ASCII logo with its scanline effect."""
+        # ASCII art logo with glow effect; every other line sits on a
+        # scanline background
+        logo = Text()
+        for i, (line, style) in enumerate((
+            ("┌─┐┬  ┌─┐┬ ┬┌┬┐┌─┐  ┌─┐┌─┐┌─┐┌─┐┌─┐┌─┐┬  ┌┬┐", self.theme.BOLD_ORANGE),
+            ("│  │  ├─┤│ │ ││├┤   └─┐│  ├─┤├┤ ├┤ │ ││   ││", self.theme.BOLD_ORANGE_LIGHT),
+            ("└─┘┴─┘┴ ┴└─┘─┴┘└─┘  └─┘└─┘┴ ┴└  └  └─┘┴─┘─┴┘", self.theme.BOLD_ORANGE_DARK),
+        )):
             if i % 2 == 0:
-                logo_with_scanlines.append(line + "\n", style=f"on {self.theme.SCANLINE}")
-            else:
-                logo_with_scanlines.append(line + "\n")
+                style = style + self.theme.ON_SCANLINE
+            logo.append(line, style=style)
+            logo.append("\n")
                 
-        header_lines.append(Align.center(logo_with_scanlines))
+        return Align.center(logo)
+        
+    def _create_header(self, title: str, subtitle: str = "") -> Panel:
+        """Create a retro header panel.
+        
+        Headers only depend on their title and subtitle, so each one is built
+        once and reused by every redraw that asks for it.
+        """
+        key = (title, subtitle)
+        header = self._header_cache.get(key)
+        if header is not None:
+            return header
+            
+        header_lines = [self._logo_renderable]
         
         if subtitle:
             header_lines.append(Text())
             header_lines.append(Align.center(
-                Text(subtitle, style=f"{self.theme.TEXT_DIM} italic")
+                Text(subtitle, style=self.theme.TEXT_DIM_ITALIC)
             ))
             
         # Current section title
         header_lines.append(Text())
         header_lines.append(Align.center(
-            Text(f"━━━ {title.upper()} ━━━", style=f"bold {self.theme.ORANGE}")
+            Text(f"━━━ {title.upper()} ━━━", style=self.theme.BOLD_ORANGE)
         ))
         
-        return Panel(
+        header = Panel(
             Group(*header_lines),
             border_style=self.theme.ORANGE,
             box=HEAVY,
             padding=(1, 2),
-            style=f"on {self.theme.BACKGROUND}"
+            style=self.theme.ON_BACKGROUND
         )
+        self._header_cache[key] = header
+        return header
         
     def _create_content_panel(self, content: Any, title: str = "") -> Panel:
         """Create a content panel with retro styling."""
         return Panel(
             content,
-            title=f"[{self.theme.ORANGE}]{'▶ ' + title if title else ''}[/]",
+            title=_panel_title(f"▶ {title}") if title else None,
             border_style=self.theme.ORANGE_DARK,
             box=DOUBLE,
             padding=(2, 4),
-            style=f"{self.theme.TEXT} on {self.theme.DARK_GRAY}",
+            style=self.theme.TEXT_ON_DARK_GRAY,
             expand=False
         )
         
+    def _create_dialog_panel(self, *renderables: Any) -> Panel:
+        """Create the centered double-bordered panel used by dialog screens."""
+        return Panel(
+            Align.center(Group(*renderables), vertical="middle"),
+            border_style=self.theme.ORANGE_DARK,
+            box=DOUBLE,
+            padding=(2, 4)
+        )
+        
+    def _create_progress_panel(self, *renderables: Any) -> Panel:
+        """Create the heavy-bordered PROCESSING panel used by progress screens."""
+        return Panel(
+            Align.center(Group(*renderables), vertical="middle"),
+            title=_panel_title("◆ PROCESSING ◆"),
+            border_style=self.theme.ORANGE,
+            box=HEAVY,
+            padding=(2, 4)
+        )
+        
     def _create_footer(self, hint: str = "") -> Panel:
         """Create a footer with hints."""
+        now = int(time.time())
+        if now != self._footer_ts[0]:
+            self._footer_ts = (now, time.strftime('%H:%M:%S', time.localtime(now)))
+            self._footer_cache.clear()
+        else:
+            footer = self._footer_cache.get(hint)
+            if footer is not None:
+                return footer
+                
         footer_text = Text()
         
         # Navigation hints
@@ -168,20 +586,22 @@ class RetroUI:
             footer_text.append(hint, style=self.theme.TEXT_DIM)
         else:
             footer_text.append("↑↓ Navigate  ", style=self.theme.TEXT_DIM)
-            footer_text.append("Enter", style=f"bold {self.theme.ORANGE}")
+            footer_text.append("Enter", style=self.theme.BOLD_ORANGE)
             footer_text.append(" Select  ", style=self.theme.TEXT_DIM)
-            footer_text.append("Ctrl+C", style=f"bold {self.theme.ORANGE}")
+            footer_text.append("Ctrl+C", style=self.theme.BOLD_ORANGE)
             footer_text.append(" Exit", style=self.theme.TEXT_DIM)
             
         # Timestamp
-        footer_text.append(f"\n{datetime.now().strftime('%H:%M:%S')}", style=self.theme.GRAY)
+        footer_text.append(f"\n{self._footer_ts[1]}", style=self.theme.GRAY)
         
-        return Panel(
+        footer = Panel(
             Align.center(footer_text),
             border_style=self.theme.GRAY,
             box=HEAVY,
-            style=f"on {self.theme.BACKGROUND}"
+            style=self.theme.ON_BACKGROUND
         )
+        self._footer_cache[hint] = footer
+        return footer
         
     def show_welcome_screen(self, project_name: str) -> None:
         """Show the welcome screen."""
@@ -202,14 +622,14 @@ class RetroUI:
         # Content
         welcome_text = Text()
         welcome_text.append(f"\n\nProject: ", style=self.theme.TEXT_DIM)
-        welcome_text.append(f"{project_name}\n\n", style=f"bold {self.theme.ORANGE}")
+        welcome_text.append(f"{project_name}\n\n", style=self.theme.BOLD_ORANGE)
         welcome_text.append("▸ Claude AI Enhanced Configuration\n", style=self.theme.ORANGE_LIGHT)
         welcome_text.append("▸ Full-Stack Project Templates\n", style=self.theme.ORANGE_LIGHT)
         welcome_text.append("▸ Test-Driven Development\n", style=self.theme.ORANGE_LIGHT)
         welcome_text.append("▸ Comprehensive Documentation\n\n", style=self.theme.ORANGE_LIGHT)
         
         welcome_text.append("Press ", style=self.theme.TEXT_DIM)
-        welcome_text.append("Enter", style=f"bold {self.theme.ORANGE}")
+        welcome_text.append("Enter", style=self.theme.BOLD_ORANGE)
         welcome_text.append(" to begin...", style=self.theme.TEXT_DIM)
         
         layout["content"].update(
@@ -225,21 +645,16 @@ class RetroUI:
         # Footer
         layout["footer"].update(self._create_footer("Press Enter to start"))
         
-        self.console.print(layout, style=f"on {self.theme.BACKGROUND}", end="")
+        self._print_frame(layout, end="")
         # Move cursor to top-left to avoid any extra lines
-        print('\033[H', end='', flush=True)
+        _write_stdout(_CURSOR_HOME)
         
         # Wait for Enter without showing cursor
-        import sys, tty, termios
-        old_settings = termios.tcgetattr(sys.stdin)
-        try:
-            tty.setraw(sys.stdin.fileno())
+        with _raw_mode():
             while True:
-                key = sys.stdin.read(1)
-                if key == '\r' or key == '\n':
+                buf = _read_bytes()
+                if b'\r' in buf or b'\n' in buf:
                     break
-        finally:
-            termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
         
     def ask_selection(
         self, 
@@ -250,9 +665,6 @@ class RetroUI:
         hint: str = ""
     ) -> Any:
         """Show a full-screen selection page with interactive selection."""
-        import sys
-        import tty
-        import termios
         
         # Process choices
         if isinstance(choices[0], dict):
@@ -260,211 +672,158 @@ class RetroUI:
         else:
             choice_items = [(str(c), c) for c in choices]
         
+        # Styled (unselected, selected) rows, built once for every frame
+        choice_rows = [
+            (
+                Text.assemble(_UNSELECTED_MARKER, (name, self.theme.TEXT_DIM)),
+                Text.assemble(_SELECTED_MARKER, (name, self.theme.BOLD_WHITE))
+            )
+            for name, _ in choice_items
+        ]
+        
         selected_index = 0
         max_visible = 10  # Maximum visible choices
         scroll_offset = 0
+        total_choices = len(choice_items)
         
-        while True:
-            self._clear_screen()
-            
-            # Create layout
-            layout = Layout()
-            layout.split_column(
-                Layout(name="header", size=9),
-                Layout(name="content", ratio=1),
-                Layout(name="footer", size=3)
-            )
-            
-            # Header
-            layout["header"].update(
-                self._create_header(title, subtitle)
-            )
-            
-            # Content
-            content_group = []
-            
-            # Question
-            question_text = Text()
-            question_text.append("\n? ", style=f"bold {self.theme.ORANGE}")
-            question_text.append(question, style=f"bold {self.theme.WHITE}")
-            question_text.append("\n\n")
-            content_group.append(Align.center(question_text))
-            
-            # Calculate visible range
-            total_choices = len(choice_items)
-            if total_choices > max_visible:
-                # Adjust scroll offset to keep selected item visible
-                if selected_index < scroll_offset:
-                    scroll_offset = selected_index
-                elif selected_index >= scroll_offset + max_visible:
-                    scroll_offset = selected_index - max_visible + 1
-                    
-                visible_start = scroll_offset
-                visible_end = min(scroll_offset + max_visible, total_choices)
-            else:
-                visible_start = 0
-                visible_end = total_choices
-            
-            # Show scroll indicator if needed
-            if visible_start > 0:
-                content_group.append(Align.center(Text("▲ More above ▲", style=self.theme.TEXT_DIM)))
-                content_group.append(Text(""))
-            
-            # Choices
-            for i in range(visible_start, visible_end):
-                choice_text = Text()
-                if i == selected_index:
-                    choice_text.append("  ► ", style=f"bold {self.theme.ORANGE}")
-                    choice_text.append(choice_items[i][0], style=f"bold {self.theme.WHITE}")
-                else:
-                    choice_text.append("    ", style="")
-                    choice_text.append(choice_items[i][0], style=self.theme.TEXT_DIM)
-                content_group.append(Align.center(choice_text))
-            
-            # Show scroll indicator if needed
-            if visible_end < total_choices:
-                content_group.append(Text(""))
-                content_group.append(Align.center(Text("▼ More below ▼", style=self.theme.TEXT_DIM)))
-            
-            # Instructions
-            content_group.append(Text("\n"))
-            instructions = Text()
-            instructions.append("↑↓ ", style=f"bold {self.theme.ORANGE}")
-            instructions.append("Navigate   ", style=self.theme.TEXT_DIM)
-            instructions.append("ENTER ", style=f"bold {self.theme.ORANGE}")
-            instructions.append("Select   ", style=self.theme.TEXT_DIM)
-            instructions.append("ESC ", style=f"bold {self.theme.ORANGE}")
-            instructions.append("Cancel", style=self.theme.TEXT_DIM)
-            content_group.append(Align.center(instructions))
-            
-            content = Panel(
-                Align.center(Group(*content_group), vertical="middle"),
-                border_style=self.theme.ORANGE_DARK,
-                box=DOUBLE,
-                padding=(2, 4)
-            )
-            
-            layout["content"].update(
-                Align.center(content, vertical="middle")
-            )
-            
-            # Footer
-            layout["footer"].update(self._create_footer(hint or "Select an option"))
-            
-            # Print layout
-            self.console.print(layout, style=f"on {self.theme.BACKGROUND}")
-            
-            # Get single keypress
-            old_settings = termios.tcgetattr(sys.stdin)
-            try:
-                tty.setraw(sys.stdin.fileno())
-                key = sys.stdin.read(1)
-                
-                if key == '\r' or key == '\n':  # Enter
-                    return choice_items[selected_index][1]
-                elif key == '\x1b':  # Escape sequence
-                    next_keys = sys.stdin.read(2)
-                    if next_keys == '[A':  # Up arrow
-                        selected_index = max(0, selected_index - 1)
-                    elif next_keys == '[B':  # Down arrow
-                        selected_index = min(len(choice_items) - 1, selected_index + 1)
-                    elif next_keys == '':  # Just ESC
-                        return None
-                elif key == '\x03':  # Ctrl+C
-                    raise KeyboardInterrupt()
-                    
-            finally:
-                termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
-        
-    def ask_text(
-        self,
-        title: str,
-        question: str,
-        default: str = "",
-        subtitle: str = "",
-        hint: str = "",
-        multiline: bool = False
-    ) -> str:
-        """Show a full-screen text input page."""
-        self._clear_screen()
-        
-        # Create layout
+        # Header and footer regions are fixed; the content region shows a
+        # pre-rendered frame per (selection, scroll window)
         layout = Layout()
         layout.split_column(
             Layout(name="header", size=9),
-            Layout(name="question", size=4),
             Layout(name="content", ratio=1),
             Layout(name="footer", size=3)
         )
+        layout["header"].update(self._create_header(title, subtitle))
+        frame = Styled(layout, self.theme.ON_BACKGROUND)
+        frames: Dict[Tuple[int, int, int, int], SegmentLines] = {}
         
-        # Header
-        layout["header"].update(
-            self._create_header(title, subtitle)
-        )
+        # Live keeps the picker on the alternate screen and redraws it in
+        # place on every keypress instead of clearing and reprinting
+        with Live(
+            console=self.console,
+            screen=True,
+            auto_refresh=False,
+            redirect_stdout=False,
+            redirect_stderr=False
+        ) as live, self._rich_cursor(), _block_buffered_stdout():
+            # Only redraw after keys that moved the selection
+            dirty = True
+            # Escape sequence cut off at the end of the last read
+            pending = b''
+            with _raw_mode():
+                while True:
+                    if dirty:
+                        dirty = False
+                        # Adjust scroll offset to keep selected item visible
+                        if total_choices > max_visible:
+                            if selected_index < scroll_offset:
+                                scroll_offset = selected_index
+                            elif selected_index >= scroll_offset + max_visible:
+                                scroll_offset = selected_index - max_visible + 1
+                            visible_start = scroll_offset
+                            visible_end = min(scroll_offset + max_visible, total_choices)
+                        else:
+                            visible_start = 0
+                            visible_end = total_choices
+                        
+                        width, height = self.console.size
+                        key = (selected_index, visible_start, width, height)
+                        content = frames.get(key)
+                        if content is None:
+                            content = SegmentLines(
+                                self.console.render_lines(
+                                    self._build_selection_content(
+                                        question, choice_rows,
+                                        selected_index, visible_start, visible_end
+                                    ),
+                                    self.console.options.update_dimensions(width, height - 12)
+                                ),
+                                new_lines=True
+                            )
+                            frames[key] = content
+                        layout["content"].update(content)
+                        layout["footer"].update(self._create_footer(hint or "Select an option"))
+                        live.update(frame, refresh=True)
+                    
+                    # Apply every key in the read, then redraw once
+                    buf = pending + _read_bytes()
+                    pending = b''
+                    previous_index = selected_index
+                    i = 0
+                    while i < len(buf):
+                        action, length = _key_action(_SELECTION_KEYS, buf, i)
+                        if not length:
+                            pending = buf[i:]
+                            break
+                        i += length
+                        
+                        if action == 'enter':
+                            return choice_items[selected_index][1]
+                        elif action == 'up':
+                            selected_index = max(0, selected_index - 1)
+                        elif action == 'down':
+                            selected_index = min(len(choice_items) - 1, selected_index + 1)
+                        elif action == 'esc':
+                            return None
+                        elif action == 'intr':
+                            raise KeyboardInterrupt()
+                    dirty = selected_index != previous_index
+        
+    def _build_selection_content(
+        self,
+        question: str,
+        choice_rows: List[Tuple[Text, Text]],
+        selected_index: int,
+        visible_start: int,
+        visible_end: int
+    ) -> Align:
+        """Build the content region of the selection picker."""
+        # Content
+        content_group = []
         
         # Question
         question_text = Text()
-        question_text.append("? ", style=f"bold {self.theme.ORANGE}")
-        question_text.append(question, style=f"bold {self.theme.WHITE}")
-        layout["question"].update(
-            Align.center(
-                Panel(
-                    Align.center(question_text),
-                    border_style=self.theme.ORANGE_DARK,
-                    box=DOUBLE,
-                    padding=(0, 2)
-                )
-            )
-        )
-        
-        # Input area preview
-        input_panel = Panel(
-            Text(f"\n{'(multiline input)' if multiline else '(text input)'}\n", 
-                 style=self.theme.TEXT_DIM, justify="center"),
-            title=f"[{self.theme.ORANGE}]▶ INPUT[/]",
-            border_style=self.theme.ORANGE,
-            box=HEAVY,
-            padding=(1, 2)
-        )
-        
-        layout["content"].update(
-            Align.center(input_panel, vertical="middle")
+        question_text.append("\n? ", style=self.theme.BOLD_ORANGE)
+        question_text.append(question, style=self.theme.BOLD_WHITE)
+        question_text.append("\n\n")
+        content_group.append(Align.center(question_text))
+        
+        # Show scroll indicator if needed
+        if visible_start > 0:
+            content_group.append(Align.center(Text("▲ More above ▲", style=self.theme.TEXT_DIM)))
+            content_group.append(Text(""))
+        
+        # Choices, one centered line each in a single Text
+        rows = Text("\n", justify="center").join(
+            choice_rows[i][i == selected_index]
+            for i in range(visible_start, visible_end)
         )
+        content_group.append(rows)
         
-        # Footer
-        layout["footer"].update(self._create_footer(hint or "Type your answer"))
-        
-        # Print layout without newline
-        self.console.print(layout, style=f"on {self.theme.BACKGROUND}", end="")
-        
-        # Clear screen again to prepare for centered input
-        self._clear_screen()
-        
-        # Calculate center position
-        term_height = self.height  # Use our adjusted height
-        center_y = term_height // 2
+        # Show scroll indicator if needed
+        if visible_end < len(choice_rows):
+            content_group.append(Text(""))
+            content_group.append(Align.center(Text("▼ More below ▼", style=self.theme.TEXT_DIM)))
         
-        # Move to center
-        for _ in range(max(0, center_y - 10)):
-            self.console.print()
+        # Instructions
+        content_group.append(Text("\n"))
+        content_group.append(Align.center(self._selection_instructions))
         
-        # Create centered question panel
-        question_panel = Panel(
-            Align.center(question_text),
-            border_style=self.theme.ORANGE_DARK,
-            box=DOUBLE,
-            padding=(1, 4),
-            width=80
-        )
-        self.console.print(Align.center(question_panel))
-        self.console.print()
+        content = self._create_dialog_panel(*content_group)
         
-        # Show default value if present
-        if default:
-            default_text = Text(f"Default: {default}", style=self.theme.TEXT_DIM)
-            self.console.print(Align.center(default_text))
-            self.console.print()
+        return Align.center(content, vertical="middle")
         
+    def ask_text(
+        self,
+        title: str,
+        question: str,
+        default: str = "",
+        subtitle: str = "",
+        hint: str = "",
+        multiline: bool = False
+    ) -> str:
+        """Show a full-screen text input page."""
         if not multiline:
             # Single line input with better layout
             self._clear_screen()
@@ -487,8 +846,8 @@ class RetroUI:
             
             # Question
             question_text = Text()
-            question_text.append("\n? ", style=f"bold {self.theme.ORANGE}")
-            question_text.append(question, style=f"bold {self.theme.WHITE}")
+            question_text.append("\n? ", style=self.theme.BOLD_ORANGE)
+            question_text.append(question, style=self.theme.BOLD_WHITE)
             question_text.append("\n\n")
             content_group.append(Align.center(question_text))
             
@@ -505,12 +864,7 @@ class RetroUI:
                 default_text.append("\n\n", style="")
                 content_group.append(Align.center(default_text))
             
-            content = Panel(
-                Align.center(Group(*content_group), vertical="middle"),
-                border_style=self.theme.ORANGE_DARK,
-                box=DOUBLE,
-                padding=(2, 4)
-            )
+            content = self._create_dialog_panel(*content_group)
             
             layout["content"].update(
                 Align.center(content, vertical="middle")
@@ -522,12 +876,12 @@ class RetroUI:
             )
             
             # Print layout
-            self.console.print(layout, style=f"on {self.theme.BACKGROUND}")
+            self._print_frame(layout)
             
             # Get input at bottom
-            print('\033[?25h', end='', flush=True)  # Show cursor
+            _write_stdout(self._cursor(True))
             answer = input("\n> ") or default
-            print('\033[?25l', end='', flush=True)  # Hide cursor
+            _write_stdout(self._cursor(False))
         else:
             # Multiline input - first ask user which mode they prefer
             mode = self.ask_selection(
@@ -546,12 +900,13 @@ class RetroUI:
                 return default
             elif mode == "simple":
                 # Use questionary with multiline support
-                self._clear_screen()
-                
-                # Show header
-                print(f"\n\033[38;2;218;119;86m{'═' * 80}\033[0m")
-                print(f"\033[38;2;218;119;86m{title.center(80)}\033[0m")
-                print(f"\033[38;2;218;119;86m{'═' * 80}\033[0m\n")
+                # Clear the screen and show the header in one write
+                rule = '═' * 80
+                _write_stdout(
+                    self._cursor(False) + _CLEAR_SCREEN + b"\n" + _ORANGE_SGR
+                    + f"{rule}\n{title.center(80)}\n{rule}".encode()
+                    + _RESET_SGR + b"\n\n"
+                )
                 
                 # Show current text if any
                 if default:
@@ -562,13 +917,14 @@ class RetroUI:
                 print("(Press Tab to toggle between single/multi-line mode)\n")
                 
                 # Use questionary for input with arrow key support
-                import questionary
                 answer = questionary.text(
                     "",
                     default=default,
                     multiline=True,
                     style=self.qstyle
                 ).ask()
+                # prompt_toolkit leaves the cursor shown
+                self._cursor_visible = True
                 
                 if answer is None:  # User cancelled
                     answer = default
@@ -587,8 +943,12 @@ class RetroUI:
                 )
                 
                 # Header
+                question_text = Text()
+                question_text.append("? ", style=self.theme.BOLD_ORANGE)
+                question_text.append(question, style=self.theme.BOLD_WHITE)
+                
                 header_group = []
-                header_group.append(Align.center(Text(title, style=f"bold {self.theme.ORANGE}")))
+                header_group.append(Align.center(Text(title, style=self.theme.BOLD_ORANGE)))
                 header_group.append(Text(""))
                 header_group.append(Align.center(question_text))
                 
@@ -602,15 +962,15 @@ class RetroUI:
                 
                 # Instructions
                 instr_lines = []
-                instr_lines.append(Text("\n  📋 PASTE MODE", style=f"bold {self.theme.ORANGE}"))
+                instr_lines.append(Text("\n  📋 PASTE MODE", style=self.theme.BOLD_ORANGE))
                 instr_lines.append(Text("  " + "─" * 60, style=self.theme.ORANGE_DARK))
                 
                 if default:
                     instr_lines.append(Text("\n  Current text preview:", style=self.theme.TEXT_DIM))
                     preview = default[:150] + "..." if len(default) > 150 else default
-                    instr_lines.append(Text(f"  {preview.split(chr(10))[0][:70]}", style=self.theme.GRAY))
+                    instr_lines.append(Text(f"  {_first_line(preview)[:70]}", style=self.theme.GRAY))
                 
-                instr_lines.append(Text("\n  📌 Instructions:", style=f"bold {self.theme.ORANGE}"))
+                instr_lines.append(Text("\n  📌 Instructions:", style=self.theme.BOLD_ORANGE))
                 instr_lines.append(Text("     1. Paste your entire text below", style=self.theme.WHITE))
                 instr_lines.append(Text("     2. Press Ctrl+D when done", style=self.theme.WHITE))
                 instr_lines.append(Text("     3. Press Ctrl+C to cancel", style=self.theme.WHITE))
@@ -627,9 +987,9 @@ class RetroUI:
                 # Footer
                 footer_text = Text()
                 footer_text.append("Paste your text below | ", style=self.theme.TEXT_DIM)
-                footer_text.append("Ctrl+D ", style=f"bold {self.theme.ORANGE}")
+                footer_text.append("Ctrl+D ", style=self.theme.BOLD_ORANGE)
                 footer_text.append("Save | ", style=self.theme.TEXT_DIM)
-                footer_text.append("Ctrl+C ", style=f"bold {self.theme.ORANGE}")
+                footer_text.append("Ctrl+C ", style=self.theme.BOLD_ORANGE)
                 footer_text.append("Cancel", style=self.theme.TEXT_DIM)
                 
                 layout["footer"].update(
@@ -637,22 +997,18 @@ class RetroUI:
                 )
                 
                 # Print layout
-                self.console.print(layout, style=f"on {self.theme.BACKGROUND}")
+                self._print_frame(layout)
                 
                 # Simple input collection
-                print(f"\n\033[38;2;218;119;86m{'─' * 80}\033[0m\n")
-                print('\033[?25h', end='', flush=True)  # Show cursor
+                # Separator and show-cursor go out in one write
+                _write_stdout(b"\n" + _ORANGE_SGR + '─'.encode() * 80 + _RESET_SGR + b"\n\n" + self._cursor(True))
                 
                 try:
-                    lines = []
-                    print("📋 Paste your text now (press Ctrl+D when done):\n")
+                    print("📋 Paste your text now (press Ctrl+D when done):\n", flush=True)
                     
-                    try:
-                        while True:
-                            line = input()
-                            lines.append(line)
-                    except EOFError:
-                        pass
+                    # One read up to Ctrl+D instead of an input() call per line
+                    data = sys.stdin.buffer.read().decode('utf-8', errors='replace')
+                    lines = data.splitlines()
                 
                     # Join all lines
                     entered_text = '\n'.join(lines) if lines else ""
@@ -672,7 +1028,7 @@ class RetroUI:
                         # Header
                         review_layout["header"].update(
                             Panel(
-                                Align.center(Text("REVIEW YOUR TEXT", style=f"bold {self.theme.ORANGE}")),
+                                Align.center(Text("REVIEW YOUR TEXT", style=self.theme.BOLD_ORANGE)),
                                 border_style=self.theme.ORANGE_DARK,
                                 box=DOUBLE
                             )
@@ -724,153 +1080,129 @@ class RetroUI:
                     answer = default
                     
                 # Hide cursor
-                print('\033[?25l', end='', flush=True)
+                _write_stdout(self._cursor(False))
         
         return answer
     
     def show_enhancement_options(self, project_description: str) -> str:
         """Show special enhancement options screen with rich UX."""
-        import sys
-        import tty
-        import termios
         
         selected = 2  # Default to option 2 (Enhance with Claude)
         
-        while True:
-            self._clear_screen()
-            
-            # Create layout
-            layout = Layout()
-            layout.split_column(
-                Layout(name="header", size=9),
-                Layout(name="content", ratio=1),
-                Layout(name="footer", size=3)
-            )
-            
-            # Header
-            layout["header"].update(
-                self._create_header("ENHANCEMENT OPTIONS", "Choose how to proceed with your project")
-            )
-            
-            # Content - Options
-            content_group = []
-            
-            # Project description (truncated if too long)
-            desc_text = Text()
-            desc_text.append("\n? ", style=f"bold {self.theme.ORANGE}")
-            desc_text.append("Project: ", style=f"bold {self.theme.WHITE}")
-            
-            # Take only first line and truncate if needed
-            first_line = project_description.split('\n')[0].strip()
-            max_desc_length = 80
-            if len(first_line) > max_desc_length:
-                truncated_desc = first_line[:max_desc_length-3] + "..."
-            else:
-                truncated_desc = first_line
-            
-            desc_text.append(truncated_desc, style=self.theme.ORANGE_LIGHT)
-            desc_text.append("\n\n")
-            content_group.append(Align.center(desc_text))
-            
-            # Options
-            options = [
-                {
-                    "num": "1",
-                    "title": "CONTINUE AS IS",
-                    "desc": "Use your original description\nwithout any modifications",
-                    "hint": "Simple projects with clear requirements"
-                },
-                {
-                    "num": "2", 
-                    "title": "ENHANCE WITH CLAUDE",
-                    "desc": "Let Claude analyze and improve\nyour project specification",
-                    "hint": "Get professional structure & best practices"
-                },
-                {
-                    "num": "3",
-                    "title": "Q&A DEEP DIVE ✨",
-                    "desc": "Interactive Q&A session with Claude\n(20-100 questions) for detailed planning",
-                    "hint": "Complex projects needing detailed specs"
-                }
-            ]
-            
-            # Show options with selection
-            for i, opt in enumerate(options, 1):
-                option_text = Text()
-                
-                if i == selected:
-                    option_text.append("\n  ► ", style=f"bold {self.theme.ORANGE}")
-                    option_text.append(f"{opt['num']}. {opt['title']}", style=f"bold {self.theme.WHITE}")
-                    option_text.append("\n     ", style="")
-                    option_text.append(opt['desc'].replace('\n', '\n     '), style=self.theme.ORANGE_LIGHT)
-                    option_text.append("\n     ", style="")
-                    option_text.append(f"[{opt['hint']}]", style=self.theme.TEXT_DIM)
-                else:
-                    option_text.append("\n    ", style="")
-                    option_text.append(f"{opt['num']}. {opt['title']}", style=self.theme.TEXT_DIM)
-                    option_text.append("\n     ", style="")
-                    option_text.append(opt['desc'].replace('\n', '\n     '), style=self.theme.GRAY)
+        # Take only first line and truncate if needed
+        first_line = _first_line(project_description).strip()
+        max_desc_length = 80
+        if len(first_line) > max_desc_length:
+            truncated_desc = first_line[:max_desc_length-3] + "..."
+        else:
+            truncated_desc = first_line
+        
+        # Header and footer are constant for this screen; only the content
+        # region changes between keypresses
+        layout = Layout()
+        layout.split_column(
+            Layout(name="header", size=9),
+            Layout(name="content", ratio=1),
+            Layout(name="footer", size=3)
+        )
+        layout["header"].update(
+            self._create_header("ENHANCEMENT OPTIONS", "Choose how to proceed with your project")
+        )
+        layout["footer"].update(self._create_footer("Select your enhancement option"))
+        
+        # Only three states exist, so each highlighted frame is built once
+        frames: Dict[int, Align] = {}
+        
+        # Keys that leave the highlight where it is do not redraw
+        drawn = None
+        # Escape sequence cut off at the end of the last read
+        pending = b''
+        with _raw_mode():
+            while True:
+                if selected != drawn:
+                    # Content - one prebuilt frame per highlighted option
+                    content = frames.get(selected)
+                    if content is None:
+                        content = self._build_enhancement_content(truncated_desc, selected)
+                        frames[selected] = content
+                    layout["content"].update(content)
+                    
+                    # Clear and print in one write
+                    self._print_frame(layout, prefix=self._cursor(False) + _CLEAR_SCREEN)
+                    drawn = selected
                 
-                content_group.append(Align.center(option_text))
-            
-            # Special note for Q&A mode
-            content_group.append(Text("\n"))
-            note_text = Text()
-            note_text.append("Note: ", style=f"bold {self.theme.ORANGE}")
-            note_text.append("Q&A mode allows you to press ", style=self.theme.TEXT_DIM)
-            note_text.append("Ctrl+\\", style=f"bold {self.theme.ORANGE}")
-            note_text.append(" when you have enough information", style=self.theme.TEXT_DIM)
-            content_group.append(Align.center(note_text))
-            
-            # Instructions
-            content_group.append(Text("\n"))
-            instructions = Text()
-            instructions.append("↑↓ ", style=f"bold {self.theme.ORANGE}")
-            instructions.append("Navigate   ", style=self.theme.TEXT_DIM)
-            instructions.append("ENTER ", style=f"bold {self.theme.ORANGE}")
-            instructions.append("Select   ", style=self.theme.TEXT_DIM)
-            instructions.append("1-3 ", style=f"bold {self.theme.ORANGE}")
-            instructions.append("Quick Select", style=self.theme.TEXT_DIM)
-            content_group.append(Align.center(instructions))
-            
-            content = Panel(
-                Align.center(Group(*content_group), vertical="middle"),
-                border_style=self.theme.ORANGE_DARK,
-                box=DOUBLE,
-                padding=(2, 4)
-            )
-            
-            layout["content"].update(
-                Align.center(content, vertical="middle")
-            )
-            
-            # Footer
-            layout["footer"].update(self._create_footer("Select your enhancement option"))
-            
-            # Print layout
-            self.console.print(layout, style=f"on {self.theme.BACKGROUND}")
-            
-            # Get input
-            old_settings = termios.tcgetattr(sys.stdin)
-            try:
-                tty.setraw(sys.stdin.fileno())
-                key = sys.stdin.read(1)
-                
-                if key == '\r' or key == '\n':  # Enter
-                    return str(selected)
-                elif key in ['1', '2', '3']:  # Direct number selection
-                    return key
-                elif key == '\x1b':  # Escape sequence
-                    next_keys = sys.stdin.read(2)
-                    if next_keys == '[A':  # Up arrow
+                # Get input; a read can hold several keys
+                buf = pending + _read_bytes()
+                pending = b''
+                i = 0
+                while i < len(buf):
+                    length = _key_length(buf, i)
+                    if not length:
+                        pending = buf[i:]
+                        break
+                    key = buf[i:i + length]
+                    i += length
+                    
+                    if key == b'\r' or key == b'\n':  # Enter
+                        return str(selected)
+                    elif key in (b'1', b'2', b'3'):  # Direct number selection
+                        return key.decode()
+                    elif key == b'\x1b[A':  # Up arrow
                         selected = max(1, selected - 1)
-                    elif next_keys == '[B':  # Down arrow
+                    elif key == b'\x1b[B':  # Down arrow
                         selected = min(3, selected + 1)
-                elif key == '\x03':  # Ctrl+C
-                    raise KeyboardInterrupt()
-                    
-            finally:
-                termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
+                    elif key == b'\x03':  # Ctrl+C
+                        raise KeyboardInterrupt()
+        
+    def _build_enhancement_content(self, truncated_desc: str, selected: int) -> Align:
+        """Build the enhancement options content with option ``selected`` highlighted."""
+        # Content - Options
+        content_group = []
+        
+        # Project description (truncated if too long)
+        desc_text = Text()
+        desc_text.append("\n? ", style=self.theme.BOLD_ORANGE)
+        desc_text.append("Project: ", style=self.theme.BOLD_WHITE)
+        desc_text.append(truncated_desc, style=self.theme.ORANGE_LIGHT)
+        desc_text.append("\n\n")
+        content_group.append(Align.center(desc_text))
+        
+        # Options, with the selected one highlighted
+        for i, option_text in enumerate(self._enh_options_unselected):
+            if i == selected - 1:
+                option_text = self._enh_options_selected[i]
+            content_group.append(Align.center(option_text))
+        
+        # Special note for Q&A mode
+        content_group.append(Text("\n"))
+        content_group.append(Align.center(self._enh_note))
+        
+        # Instructions
+        content_group.append(Text("\n"))
+        content_group.append(Align.center(self._enh_instructions))
+        
+        content = self._create_dialog_panel(*content_group)
+        
+        return Align.center(content, vertical="middle")
+        
+    def _build_enhancement_option(self, opt: Dict[str, str], selected: bool) -> Text:
+        """Build one enhancement option entry."""
+        option_text = Text()
+        
+        if selected:
+            option_text.append("\n  ► ", style=self.theme.BOLD_ORANGE)
+            option_text.append(f"{opt['num']}. {opt['title']}", style=self.theme.BOLD_WHITE)
+            option_text.append("\n     ", style="")
+            option_text.append(opt['desc'].replace('\n', '\n     '), style=self.theme.ORANGE_LIGHT)
+            option_text.append("\n     ", style="")
+            option_text.append(f"[{opt['hint']}]", style=self.theme.TEXT_DIM)
+        else:
+            option_text.append("\n    ", style="")
+            option_text.append(f"{opt['num']}. {opt['title']}", style=self.theme.TEXT_DIM)
+            option_text.append("\n     ", style="")
+            option_text.append(opt['desc'].replace('\n', '\n     '), style=self.theme.GRAY)
+            
+        return option_text
         
     def ask_confirm(
         self,
@@ -881,106 +1213,101 @@ class RetroUI:
         hint: str = ""
     ) -> bool:
         """Show a full-screen confirmation page with interactive selection."""
-        import sys
-        import tty
-        import termios
         
         selected = default  # True = Yes, False = No
         
-        while True:
-            self._clear_screen()
-            
-            # Create layout
-            layout = Layout()
-            layout.split_column(
-                Layout(name="header", size=9),
-                Layout(name="content", ratio=1),
-                Layout(name="footer", size=3)
-            )
-            
-            # Header
-            layout["header"].update(
-                self._create_header(title, subtitle)
-            )
-            
-            # Content
-            confirm_text = Text()
-            confirm_text.append("\n\n? ", style=f"bold {self.theme.ORANGE}")
-            confirm_text.append(question, style=f"bold {self.theme.WHITE}")
-            confirm_text.append("\n\n\n")
-            
-            # Yes/No options with current selection
-            options = Text()
-            if selected:
-                options.append("    ►  ", style=f"bold {self.theme.ORANGE}")
-                options.append("YES", style=f"bold {self.theme.WHITE}")
-                options.append("        ", style=self.theme.GRAY)
-                options.append("NO", style=self.theme.TEXT_DIM)
-            else:
-                options.append("       ", style=self.theme.GRAY)
-                options.append("YES", style=self.theme.TEXT_DIM)
-                options.append("     ►  ", style=f"bold {self.theme.ORANGE}")
-                options.append("NO", style=f"bold {self.theme.WHITE}")
-            
-            options.append("\n\n", style="")
-            
-            # Instructions
-            instructions = Text()
-            instructions.append("← → ", style=f"bold {self.theme.ORANGE}")
-            instructions.append("Navigate   ", style=self.theme.TEXT_DIM)
-            instructions.append("ENTER ", style=f"bold {self.theme.ORANGE}")
-            instructions.append("Confirm   ", style=self.theme.TEXT_DIM)
-            instructions.append("Y/N ", style=f"bold {self.theme.ORANGE}")
-            instructions.append("Quick Select", style=self.theme.TEXT_DIM)
-            
-            content = Panel(
-                Align.center(Group(confirm_text, options, instructions), vertical="middle"),
-                border_style=self.theme.ORANGE_DARK,
-                box=DOUBLE,
-                padding=(2, 4)
-            )
-            
-            layout["content"].update(
-                Align.center(content, vertical="middle")
-            )
-            
-            # Footer
-            layout["footer"].update(
-                self._create_footer(hint or "Select your choice")
-            )
-            
-            # Print layout
-            self.console.print(layout, style=f"on {self.theme.BACKGROUND}")
-            
-            # Get single keypress
-            old_settings = termios.tcgetattr(sys.stdin)
-            try:
-                tty.setraw(sys.stdin.fileno())
-                key = sys.stdin.read(1)
+        # Header and footer are constant for this screen; only the content
+        # region changes between keypresses
+        layout = Layout()
+        layout.split_column(
+            Layout(name="header", size=9),
+            Layout(name="content", ratio=1),
+            Layout(name="footer", size=3)
+        )
+        layout["header"].update(
+            self._create_header(title, subtitle)
+        )
+        layout["footer"].update(
+            self._create_footer(hint or "Select your choice")
+        )
+        
+        # YES/NO are the only two states, so each frame is built once
+        frames: Dict[bool, Align] = {}
+        
+        # Keys that leave the highlight where it is do not redraw
+        drawn = None
+        # Escape sequence cut off at the end of the last read
+        pending = b''
+        with _raw_mode():
+            while True:
+                if selected != drawn:
+                    # Content - one prebuilt frame per selection state
+                    content = frames.get(selected)
+                    if content is None:
+                        content = self._build_confirm_content(question, selected)
+                        frames[selected] = content
+                    layout["content"].update(content)
+                    
+                    # Clear and print in one write
+                    self._print_frame(layout, prefix=self._cursor(False) + _CLEAR_SCREEN)
+                    drawn = selected
                 
-                if key == '\r' or key == '\n':  # Enter
-                    # Clear screen before returning
-                    self._clear_screen()
-                    return selected
-                elif key.lower() == 'y':
-                    # Clear screen before returning
-                    self._clear_screen()
-                    return True
-                elif key.lower() == 'n':
-                    # Clear screen before returning
-                    self._clear_screen()
-                    return False
-                elif key == '\x1b':  # Escape sequence
-                    next_key = sys.stdin.read(2)
-                    if next_key == '[C':  # Right arrow
+                # Get input; a read can hold several keys
+                buf = pending + _read_bytes()
+                pending = b''
+                i = 0
+                while i < len(buf):
+                    length = _key_length(buf, i)
+                    if not length:
+                        pending = buf[i:]
+                        break
+                    key = buf[i:i + length]
+                    i += length
+                    
+                    if key == b'\r' or key == b'\n':  # Enter
+                        # Clear screen before returning
+                        self._clear_screen()
+                        return selected
+                    elif key in (b'y', b'Y'):
+                        # Clear screen before returning
+                        self._clear_screen()
+                        return True
+                    elif key in (b'n', b'N'):
+                        # Clear screen before returning
+                        self._clear_screen()
+                        return False
+                    elif key == b'\x1b[C':  # Right arrow
                         selected = False
-                    elif next_key == '[D':  # Left arrow
+                    elif key == b'\x1b[D':  # Left arrow
                         selected = True
-                elif key == '\x03':  # Ctrl+C
-                    raise KeyboardInterrupt()
-                    
-            finally:
-                termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
+                    elif key == b'\x03':  # Ctrl+C
+                        raise KeyboardInterrupt()
+        
+    def _build_confirm_content(self, question: str, selected: bool) -> Align:
+        """Build the confirmation content with YES (``True``) or NO highlighted."""
+        confirm_text = Text()
+        confirm_text.append("\n\n? ", style=self.theme.BOLD_ORANGE)
+        confirm_text.append(question, style=self.theme.BOLD_WHITE)
+        confirm_text.append("\n\n\n")
+        
+        # Yes/No options with current selection
+        options = Text()
+        if selected:
+            options.append("    ►  ", style=self.theme.BOLD_ORANGE)
+            options.append("YES", style=self.theme.BOLD_WHITE)
+            options.append("        ", style=self.theme.GRAY)
+            options.append("NO", style=self.theme.TEXT_DIM)
+        else:
+            options.append("       ", style=self.theme.GRAY)
+            options.append("YES", style=self.theme.TEXT_DIM)
+            options.append("     ►  ", style=self.theme.BOLD_ORANGE)
+            options.append("NO", style=self.theme.BOLD_WHITE)
+        
+        options.append("\n\n", style="")
+        
+        content = self._create_dialog_panel(confirm_text, options, self._confirm_instructions)
+        
+        return Align.center(content, vertical="middle")
         
     def show_progress(
         self,
@@ -990,9 +1317,6 @@ class RetroUI:
         items: Optional[List[str]] = None
     ):
         """Show a full-screen progress page with smooth animation."""
-        import threading
-        import time
-        from rich.live import Live
         
         # Animation frames for retro loading
         loading_frames = [
@@ -1022,88 +1346,64 @@ class RetroUI:
         spinner_frames = ["◐", "◓", "◑", "◒"]
         
         self.loading_active = True
+        self._stop_event.clear()
         frame_index = 0
         spinner_index = 0
         
+        # Truncate long messages to prevent overflow
+        display_message = message
+        if '\n' in message:
+            # For multiline messages, take only the first line
+            display_message = _first_line(message).strip()
+        
+        # Further truncate if still too long
+        max_msg_length = 60
+        if len(display_message) > max_msg_length:
+            display_message = display_message[:max_msg_length-3] + "..."
+            
+        # Limit items shown to prevent overflow, truncating long ones
+        display_items = tuple(
+            item[:50] + "..." if len(item) > 50 else item
+            for item in (items or [])[-5:]
+        )
+        
+        # The spinner period divides the loading bar's, so the animation
+        # cycles through len(loading_frames) distinct content regions. Each
+        # one is rendered to segments the first time it is shown.
+        rendered: Dict[Tuple[int, int, int], SegmentLines] = {}
+        
+        # One layout tree for the whole animation; each tick only swaps the
+        # content and footer regions
+        layout = Layout()
+        layout.split_column(
+            Layout(name="header", size=9),
+            Layout(name="content", ratio=1),
+            Layout(name="footer", size=3)
+        )
+        layout["header"].update(
+            self._create_header(title, subtitle)
+        )
+        
         def generate_frame():
             nonlocal frame_index, spinner_index
             
-            # Create layout
-            layout = Layout()
-            layout.split_column(
-                Layout(name="header", size=9),
-                Layout(name="content", ratio=1),
-                Layout(name="footer", size=3)
-            )
-            
-            # Header
-            layout["header"].update(
-                self._create_header(title, subtitle)
-            )
-            
             # Progress content
-            progress_group = []
-            
-            # Truncate long messages to prevent overflow
-            display_message = message
-            if '\n' in message:
-                # For multiline messages, take only the first line
-                display_message = message.split('\n')[0].strip()
-            
-            # Further truncate if still too long
-            max_msg_length = 60
-            if len(display_message) > max_msg_length:
-                display_message = display_message[:max_msg_length-3] + "..."
-            
-            # Message
-            msg_text = Text(f"\n{display_message}\n", style=f"bold {self.theme.WHITE}")
-            progress_group.append(Align.center(msg_text))
-            
-            # Loading bar
-            loading_text = Text()
-            loading_text.append("  ", style="")
-            loading_text.append(loading_frames[frame_index], style=f"bold {self.theme.ORANGE}")
-            loading_text.append("  ", style="")
-            progress_group.append(Align.center(loading_text))
-            progress_group.append(Text(""))
-            
-            # Spinner with text
-            spinner_text = Text()
-            spinner_text.append(spinner_frames[spinner_index], style=f"bold {self.theme.ORANGE}")
-            spinner_text.append(" PROCESSING ", style=f"bold {self.theme.WHITE}")
-            spinner_text.append(spinner_frames[spinner_index], style=f"bold {self.theme.ORANGE}")
-            progress_group.append(Align.center(spinner_text))
-            
-            # Items if provided
-            if items:
-                progress_group.append(Text("\n"))
-                # Limit items shown to prevent overflow
-                visible_items = items[-5:] if len(items) > 5 else items
-                for i, item in enumerate(visible_items):
-                    item_text = Text()
-                    # Truncate long items
-                    display_item = item[:50] + "..." if len(item) > 50 else item
-                    
-                    # Animate current item (last one)
-                    if i == len(visible_items) - 1:
-                        item_text.append(f"{spinner_frames[spinner_index]} ", style=f"bold {self.theme.ORANGE}")
-                        item_text.append(display_item, style=f"bold {self.theme.WHITE}")
-                    else:
-                        item_text.append("✓ ", style=f"bold {self.theme.GREEN}")
-                        item_text.append(display_item, style=self.theme.TEXT_DIM)
-                    progress_group.append(Align.center(item_text))
-            
-            content = Panel(
-                Align.center(Group(*progress_group), vertical="middle"),
-                title=f"[{self.theme.ORANGE}]◆ PROCESSING ◆[/]",
-                border_style=self.theme.ORANGE,
-                box=HEAVY,
-                padding=(2, 4)
-            )
-            
-            layout["content"].update(
-                Align.center(content, vertical="middle")
-            )
+            width, height = self.console.size
+            key = (frame_index, width, height)
+            content = rendered.get(key)
+            if content is None:
+                content = SegmentLines(
+                    self.console.render_lines(
+                        self._build_progress_content(
+                            display_message, display_items,
+                            loading_frames[frame_index], spinner_frames[spinner_index]
+                        ),
+                        self.console.options.update_dimensions(width, height - 12)
+                    ),
+                    new_lines=True
+                )
+                rendered[key] = content
+            layout["content"].update(content)
             
             # Footer
             layout["footer"].update(
@@ -1116,31 +1416,88 @@ class RetroUI:
             
             return layout
         
+        # Without a terminal nobody sees the animation; report the status
+        # once instead of streaming frames into a pipe or file
+        if not self._stdout_isatty:
+            self.console.print(f"{title}: {display_message}")
+            return
+        
         # Clear screen once
         self._clear_screen()
         
-        # Use Live display to prevent flickering
+        # Use Live display to prevent flickering. The animation thread drives
+        # every refresh, so Live's own refresh thread is not started.
         self.live_display = Live(
             generate_frame(),
             console=self.console,
-            refresh_per_second=10,
+            auto_refresh=False,
             transient=False,
             screen=True  # Use alternate screen buffer
         )
         
         def animate():
-            with self.live_display:
-                while self.loading_active:
-                    self.live_display.update(generate_frame())
-                    time.sleep(0.1)
+            # Waiting on the event instead of sleeping lets stop_progress()
+            # wake the thread immediately rather than after the current tick
+            with self.live_display, self._rich_cursor():
+                while not self._stop_event.wait(1 / self.refresh_rate):
+                    self.live_display.update(generate_frame(), refresh=True)
         
         # Start animation in background thread
         self.animation_thread = threading.Thread(target=animate, daemon=True)
         self.animation_thread.start()
     
+    def _build_progress_content(
+        self,
+        display_message: str,
+        display_items: Tuple[str, ...],
+        loading_frame: str,
+        spinner_frame: str
+    ) -> Align:
+        """Build the content region of one progress animation frame."""
+        progress_group = []
+        
+        # Message
+        msg_text = Text(f"\n{display_message}\n", style=self.theme.BOLD_WHITE)
+        progress_group.append(Align.center(msg_text))
+        
+        # Loading bar
+        loading_text = Text()
+        loading_text.append("  ", style="")
+        loading_text.append(loading_frame, style=self.theme.BOLD_ORANGE)
+        loading_text.append("  ", style="")
+        progress_group.append(Align.center(loading_text))
+        progress_group.append(Text(""))
+        
+        # Spinner with text
+        spinner_text = Text()
+        spinner_text.append(spinner_frame, style=self.theme.BOLD_ORANGE)
+        spinner_text.append(" PROCESSING ", style=self.theme.BOLD_WHITE)
+        spinner_text.append(spinner_frame, style=self.theme.BOLD_ORANGE)
+        progress_group.append(Align.center(spinner_text))
+        
+        # Items if provided
+        if display_items:
+            progress_group.append(Text("\n"))
+            for i, display_item in enumerate(display_items):
+                item_text = Text()
+                
+                # Animate current item (last one)
+                if i == len(display_items) - 1:
+                    item_text.append(f"{spinner_frame} ", style=self.theme.BOLD_ORANGE)
+                    item_text.append(display_item, style=self.theme.BOLD_WHITE)
+                else:
+                    item_text.append("✓ ", style=self.theme.BOLD_GREEN)
+                    item_text.append(display_item, style=self.theme.TEXT_DIM)
+                progress_group.append(Align.center(item_text))
+        
+        content = self._create_progress_panel(*progress_group)
+        
+        return Align.center(content, vertical="middle")
+        
     def stop_progress(self):
         """Stop the progress animation."""
         self.loading_active = False
+        self._stop_event.set()
         if hasattr(self, 'animation_thread'):
             self.animation_thread.join(timeout=0.5)
         if hasattr(self, 'live_display'):
@@ -1148,11 +1505,9 @@ class RetroUI:
                 self.live_display.stop()
             except:
                 pass
-        # Always clear screen and reset console state
-        self._clear_screen()
-        # Ensure console is in a good state
-        self.console.clear()
-        print('\033[?25h', end='', flush=True)  # Show cursor
+        # Always clear screen and show the cursor again, in one write
+        _write_stdout(_CLEAR_SCREEN + _SHOW_CURSOR)
+        self._cursor_visible = True
     
     def ask_feedback(
         self,
@@ -1180,17 +1535,25 @@ class RetroUI:
         
         # Content - show current value
         content_group = []
-        content_group.append(Text("\nCurrent suggestion:\n", style=f"bold {self.theme.WHITE}"))
+        content_group.append(Text("\nCurrent suggestion:\n", style=self.theme.BOLD_WHITE))
         
         if value_type == "text":
-            # Wrap text for better display
-            lines = str(current_value).split('\n')
-            for line in lines[:10]:  # Show first 10 lines
+            # Wrap text for better display. Only the first 10 lines are
+            # split out; the rest of the text is just counted.
+            text = str(current_value)
+            end = -1
+            for _ in range(10):
+                end = text.find('\n', end + 1)
+                if end == -1:
+                    break
+            lines = (text if end == -1 else text[:end]).split('\n')
+            for line in lines:  # Show first 10 lines
                 if len(line) > 80:
                     line = line[:77] + "..."
                 content_group.append(Text(f"  {line}", style=self.theme.ORANGE_LIGHT))
-            if len(lines) > 10:
-                content_group.append(Text(f"  ... and {len(lines) - 10} more lines", style=self.theme.TEXT_DIM))
+            if end != -1:
+                more_lines = text.count('\n', end)
+                content_group.append(Text(f"  ... and {more_lines} more lines", style=self.theme.TEXT_DIM))
         elif value_type == "list":
             for i, item in enumerate(current_value[:5], 1):
                 content_group.append(Text(f"  {i}. {str(item)[:80]}", style=self.theme.ORANGE_LIGHT))
@@ -1203,7 +1566,7 @@ class RetroUI:
                 content_group.append(Text(f"  ... and {len(current_value) - 5} more items", style=self.theme.TEXT_DIM))
         
         content_group.append(Text("\n"))
-        content_group.append(Text("Would you like to refine this suggestion?", style=f"bold {self.theme.WHITE}"))
+        content_group.append(Text("Would you like to refine this suggestion?", style=self.theme.BOLD_WHITE))
         
         layout["content"].update(
             Panel(
@@ -1217,13 +1580,13 @@ class RetroUI:
         # Input area
         input_text = Text()
         input_text.append("Enter feedback or press ", style=self.theme.TEXT_DIM)
-        input_text.append("ENTER", style=f"bold {self.theme.ORANGE}")
+        input_text.append("ENTER", style=self.theme.BOLD_ORANGE)
         input_text.append(" to accept as-is", style=self.theme.TEXT_DIM)
         
         layout["input"].update(
             Panel(
                 Align.center(input_text),
-                title=f"[{self.theme.ORANGE}]▌ FEEDBACK ▐[/]",
+                title=_panel_title("▌ FEEDBACK ▐"),
                 border_style=self.theme.ORANGE,
                 box=MINIMAL,
                 padding=(1, 2)
@@ -1235,13 +1598,12 @@ class RetroUI:
             self._create_footer("Type your feedback or press ENTER to skip")
         )
         
-        # Print layout
-        self.console.print(layout, style=f"on {self.theme.BACKGROUND}", end="")
+        # Print layout without newline, showing the cursor in the same write
+        self._print_frame(layout, suffix=self._cursor(True), end="")
         
         # Get feedback
-        print('\033[?25h', end='', flush=True)  # Show cursor
         feedback = input().strip()
-        print('\033[?25l', end='', flush=True)  # Hide cursor
+        _write_stdout(self._cursor(False))
         
         return feedback if feedback else None
         
@@ -1271,7 +1633,7 @@ class RetroUI:
         # Results table
         table = Table(
             show_header=True,
-            header_style=f"bold {self.theme.ORANGE}",
+            header_style=self.theme.BOLD_ORANGE,
             border_style=self.theme.ORANGE_DARK,
             box=HEAVY,
             padding=(0, 1)
@@ -1310,7 +1672,7 @@ class RetroUI:
         )
         
         # Print layout without newline
-        self.console.print(layout, style=f"on {self.theme.BACKGROUND}", end="")
+        self._print_frame(layout, end="")
         
         if actions:
             # Get action selection
@@ -1322,17 +1684,13 @@ class RetroUI:
             except ValueError:
                 pass
         else:
-            # Wait for Enter without showing cursor
-            import sys, tty, termios
-            old_settings = termios.tcgetattr(sys.stdin)
-            try:
-                tty.setraw(sys.stdin.fileno())
+            # Wait for Enter without showing cursor, scanning each burst of
+            # input at once rather than reading byte by byte
+            with _raw_mode():
                 while True:
-                    key = sys.stdin.read(1)
-                    if key == '\r' or key == '\n':
+                    buf = _read_bytes(4096)
+                    if b'\r' in buf or b'\n' in buf:
                         break
-            finally:
-                termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
             
         return None
     
@@ -1344,128 +1702,144 @@ class RetroUI:
         items_per_page: int = 8
     ) -> None:
         """Show results with pagination for large datasets."""
-        import sys
-        import tty
-        import termios
         
-        items = list(results.items())
-        total_items = len(items)
+        # Stringify every row once up front; pages only slice this list
+        rows = [(str(key), str(value)) for key, value in results.items()]
+        total_items = len(rows)
         total_pages = (total_items + items_per_page - 1) // items_per_page
+        
+        # Widest key on each page, for the Property column width
+        page_widths = [
+            max(len(key) for key, _ in rows[start:start + items_per_page])
+            for start in range(0, total_items, items_per_page)
+        ]
         current_page = 0
+        page_contents: Dict[int, Align] = {}
+        page_headers: Dict[int, Panel] = {}
         
-        while True:
-            self._clear_screen()
-            
-            # Create layout
-            layout = Layout()
-            layout.split_column(
-                Layout(name="header", size=9),
-                Layout(name="content", ratio=1),
-                Layout(name="footer", size=3)
-            )
-            
-            # Header
-            page_subtitle = f"{subtitle} - Page {current_page + 1} of {total_pages}"
-            layout["header"].update(
-                self._create_header(title, page_subtitle)
-            )
-            
-            # Get items for current page
-            start_idx = current_page * items_per_page
-            end_idx = min(start_idx + items_per_page, total_items)
-            page_items = items[start_idx:end_idx]
-            
-            # Results table for current page
-            table = Table(
-                show_header=True,
-                header_style=f"bold {self.theme.ORANGE}",
-                border_style=self.theme.ORANGE_DARK,
-                box=HEAVY,
-                padding=(0, 1)
-            )
-            
-            # Dynamically adjust column widths based on content
-            max_key_length = max(len(str(key)) for key, _ in page_items) if page_items else 20
-            key_width = min(max_key_length + 2, 30)
-            
-            table.add_column("Property", style=self.theme.TEXT_DIM, width=key_width, no_wrap=True)
-            table.add_column("Value", style=self.theme.WHITE, overflow="fold", max_width=self.width - key_width - 20)
-            
-            for key, value in page_items:
-                value_str = str(value)
-                table.add_row(key, value_str)
-            
-            # Navigation info
-            nav_text = Text()
-            nav_text.append(f"\n\nShowing items {start_idx + 1}-{end_idx} of {total_items}", 
-                           style=self.theme.TEXT_DIM)
-            
-            if total_pages > 1:
-                nav_text.append("\n\n")
-                if current_page > 0:
-                    nav_text.append("◀ PREV ", style=f"bold {self.theme.ORANGE}")
-                else:
-                    nav_text.append("◀ PREV ", style=self.theme.GRAY)
+        # The footer only depends on the page count, so it is built once; the
+        # header carries the page number and is built once per visited page
+        layout = Layout()
+        layout.split_column(
+            Layout(name="header", size=9),
+            Layout(name="content", ratio=1),
+            Layout(name="footer", size=3)
+        )
+        
+        if total_pages > 1:
+            footer_hint = "◀ ▶ Navigate pages | ENTER Continue"
+        else:
+            footer_hint = "Press ENTER to continue"
+        layout["footer"].update(
+            self._create_footer(footer_hint)
+        )
+
+        # Keys that stay on the current page do not redraw
+        drawn = None
+        # Escape sequence cut off at the end of the last read
+        pending = b''
+        with _raw_mode():
+            while True:
+                if current_page != drawn:
+                    # Header
+                    header = page_headers.get(current_page)
+                    if header is None:
+                        page_subtitle = f"{subtitle} - Page {current_page + 1} of {total_pages}"
+                        header = self._create_header(title, page_subtitle)
+                        page_headers[current_page] = header
+                    layout["header"].update(header)
                     
-                nav_text.append("| ", style=self.theme.TEXT_DIM)
-                
-                if current_page < total_pages - 1:
-                    nav_text.append("NEXT ▶", style=f"bold {self.theme.ORANGE}")
-                else:
-                    nav_text.append("NEXT ▶", style=self.theme.GRAY)
+                    # Page content (results don't change during the call, so revisiting
+                    # a page reuses everything built on the first visit)
+                    page_content = page_contents.get(current_page)
+                    if page_content is None:
+                        # Get items for current page
+                        start_idx = current_page * items_per_page
+                        end_idx = min(start_idx + items_per_page, total_items)
+                        page_rows = rows[start_idx:end_idx]
                     
-                nav_text.append(" | ", style=self.theme.TEXT_DIM)
-                nav_text.append("ENTER ", style=f"bold {self.theme.ORANGE}")
-                nav_text.append("Continue", style=self.theme.WHITE)
-            else:
-                nav_text.append("\n\nPress ")
-                nav_text.append("ENTER ", style=f"bold {self.theme.ORANGE}")
-                nav_text.append("to continue", style=self.theme.WHITE)
-            
-            content = Group(
-                Align.center(table),
-                Align.center(nav_text)
-            )
-            
-            layout["content"].update(
-                Align.center(
-                    self._create_content_panel(content, "RESULTS"),
-                    vertical="middle"
-                )
-            )
-            
-            # Footer
-            if total_pages > 1:
-                footer_hint = "◀ ▶ Navigate pages | ENTER Continue"
-            else:
-                footer_hint = "Press ENTER to continue"
-                
-            layout["footer"].update(
-                self._create_footer(footer_hint)
-            )
-            
-            # Print layout
-            self.console.print(layout, style=f"on {self.theme.BACKGROUND}")
-            
-            # Get input
-            old_settings = termios.tcgetattr(sys.stdin)
-            try:
-                tty.setraw(sys.stdin.fileno())
-                key = sys.stdin.read(1)
+                        # Results table for current page
+                        table = Table(
+                            show_header=True,
+                            header_style=self.theme.BOLD_ORANGE,
+                            border_style=self.theme.ORANGE_DARK,
+                            box=HEAVY,
+                            padding=(0, 1)
+                        )
+                    
+                        # Dynamically adjust column widths based on content
+                        max_key_length = page_widths[current_page] if page_rows else 20
+                        key_width = min(max_key_length + 2, 30)
+                    
+                        table.add_column("Property", style=self.theme.TEXT_DIM, width=key_width, no_wrap=True)
+                        table.add_column("Value", style=self.theme.WHITE, overflow="fold", max_width=self.width - key_width - 20)
+                    
+                        for key, value_str in page_rows:
+                            table.add_row(key, value_str)
+                    
+                        # Navigation info
+                        nav_text = Text()
+                        nav_text.append(f"\n\nShowing items {start_idx + 1}-{end_idx} of {total_items}", 
+                                       style=self.theme.TEXT_DIM)
+                    
+                        if total_pages > 1:
+                            nav_text.append("\n\n")
+                            if current_page > 0:
+                                nav_text.append("◀ PREV ", style=self.theme.BOLD_ORANGE)
+                            else:
+                                nav_text.append("◀ PREV ", style=self.theme.GRAY)
+                    
+                            nav_text.append("| ", style=self.theme.TEXT_DIM)
+                    
+                            if current_page < total_pages - 1:
+                                nav_text.append("NEXT ▶", style=self.theme.BOLD_ORANGE)
+                            else:
+                                nav_text.append("NEXT ▶", style=self.theme.GRAY)
+                    
+                            nav_text.append(" | ", style=self.theme.TEXT_DIM)
+                            nav_text.append("ENTER ", style=self.theme.BOLD_ORANGE)
+                            nav_text.append("Continue", style=self.theme.WHITE)
+                        else:
+                            nav_text.append("\n\nPress ")
+                            nav_text.append("ENTER ", style=self.theme.BOLD_ORANGE)
+                            nav_text.append("to continue", style=self.theme.WHITE)
+                    
+                        content = Group(
+                            Align.center(table),
+                            Align.center(nav_text)
+                        )
+                    
+                        page_content = Align.center(
+                            self._create_content_panel(content, "RESULTS"),
+                            vertical="middle"
+                        )
+                        page_contents[current_page] = page_content
+                    layout["content"].update(page_content)
+                    
+                    # Clear and print in one write
+                    self._print_frame(layout, prefix=self._cursor(False) + _CLEAR_SCREEN)
+                    drawn = current_page
                 
-                if key == '\r' or key == '\n':  # Enter - continue
-                    break
-                elif key == '\x1b':  # Arrow keys
-                    next_keys = sys.stdin.read(2)
-                    if next_keys == '[D' and current_page > 0:  # Left arrow - previous page
+                # Get input; a read can hold several keys
+                buf = pending + _read_bytes()
+                pending = b''
+                i = 0
+                while i < len(buf):
+                    length = _key_length(buf, i)
+                    if not length:
+                        pending = buf[i:]
+                        break
+                    key = buf[i:i + length]
+                    i += length
+                    
+                    if key == b'\r' or key == b'\n':  # Enter - continue
+                        return
+                    elif key == b'\x1b[D' and current_page > 0:  # Left arrow - previous page
                         current_page -= 1
-                    elif next_keys == '[C' and current_page < total_pages - 1:  # Right arrow - next page
+                    elif key == b'\x1b[C' and current_page < total_pages - 1:  # Right arrow - next page
                         current_page += 1
-                elif key == '\x03':  # Ctrl+C
-                    raise KeyboardInterrupt()
-                    
-            finally:
-                termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
+                    elif key == b'\x03':  # Ctrl+C
+                        raise KeyboardInterrupt()
         
     def show_completion(
         self,
@@ -1492,8 +1866,8 @@ class RetroUI:
         
         # Success content
         success_text = Text()
-        success_text.append("\n✓ ", style=f"bold {self.theme.ORANGE}")
-        success_text.append(f"{message}\n\n", style=f"bold {self.theme.WHITE}")
+        success_text.append("\n✓ ", style=self.theme.BOLD_ORANGE)
+        success_text.append(f"{message}\n\n", style=self.theme.BOLD_WHITE)
         
         if details:
             for key, value in details.items():
@@ -1503,7 +1877,7 @@ class RetroUI:
         # ASCII art success indicator
         success_art = Text()
         success_art.append("\n\n╭─────────╮\n", style=self.theme.ORANGE)
-        success_art.append("│ SUCCESS │\n", style=f"bold {self.theme.ORANGE}")
+        success_art.append("│ SUCCESS │\n", style=self.theme.BOLD_ORANGE)
         success_art.append("╰─────────╯", style=self.theme.ORANGE)
         
         content = Panel(
@@ -1526,19 +1900,139 @@ class RetroUI:
         )
         
         # Print layout without newline
-        self.console.print(layout, style=f"on {self.theme.BACKGROUND}", end="")
+        self._print_frame(layout, end="")
         
-        # Wait for Enter without showing cursor
-        import sys, tty, termios
-        old_settings = termios.tcgetattr(sys.stdin)
-        try:
-            tty.setraw(sys.stdin.fileno())
+        # Wait for Enter in raw mode so typed keys are not echoed over the frame
+        with _raw_mode():
             while True:
-                key = sys.stdin.read(1)
-                if key == '\r' or key == '\n':
+                buf = _read_bytes()
+                if b'\r' in buf or b'\n' in buf:
                     break
-        finally:
-            termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
+    
+    def _draw_static_qa_frame(
+        self,
+        title: str,
+        subtitle: str,
+        question: str,
+        question_number: int,
+        category: str,
+        show_skip: bool,
+        question_area_size: int,
+        input_area_size: int,
+        box_rows: int
+    ) -> None:
+        """Clear the screen and draw the static Q&A screen around the input box.
+        
+        Only the hand-drawn input box changes while an answer is typed, so
+        the header, question, hint and footer regions go through Rich once
+        per question and the rendered bytes are reused after that. (The
+        footer's clock line is clipped by its 3-row region, so the cached
+        frame never shows a stale time.)
+        """
+        if self.console.width != self._qa_frame_width:
+            self._qa_frame_width = self.console.width
+            self._qa_frame_cache.clear()
+        key = (title, subtitle, question, question_number, category, show_skip)
+        frame = self._qa_frame_cache.get(key)
+        if frame is None:
+            frame = self._render_frame(self._create_qa_layout(
+                title, subtitle, question, question_number, category,
+                show_skip, question_area_size, input_area_size, box_rows
+            ))
+            self._qa_frame_cache[key] = frame
+        _write_stdout(self._cursor(False) + _CLEAR_SCREEN + frame)
+    
+    def _create_qa_layout(
+        self,
+        title: str,
+        subtitle: str,
+        question: str,
+        question_number: int,
+        category: str,
+        show_skip: bool,
+        question_area_size: int,
+        input_area_size: int,
+        box_rows: int
+    ) -> Layout:
+        """Create the static Q&A screen around the input box."""
+        layout = Layout()
+        layout.split_column(
+            Layout(name="header", size=9),
+            Layout(name="question", size=question_area_size),
+            Layout(name="input_area", size=input_area_size),
+            Layout(name="footer", size=3)
+        )
+        
+        # Header
+        layout["header"].update(
+            self._create_header(title, subtitle)
+        )
+        
+        # Question panel
+        question_group = []
+        cat_text = Text()
+        cat_text.append(f"Category: ", style=self.theme.TEXT_DIM)
+        cat_text.append(category.upper(), style=self.theme.BOLD_ORANGE)
+        cat_text.append(f"  |  Question ", style=self.theme.TEXT_DIM)
+        cat_text.append(str(question_number), style=self.theme.BOLD_ORANGE)
+        question_group.append(Align.center(cat_text))
+        question_group.append(Text())
+        
+        q_text = Text()
+        q_text.append("? ", style=self.theme.BOLD_ORANGE)
+        wrapped_q = _wrap_question(question, min(100, self.width - 20))
+        q_text.append(wrapped_q, style=self.theme.BOLD_WHITE)
+        question_group.append(Align.center(q_text))
+        
+        layout["question"].update(
+            Panel(
+                Align.center(Group(*question_group), vertical="middle"),
+                border_style=self.theme.ORANGE_DARK,
+                box=DOUBLE,
+                padding=(1, 4),
+                expand=True
+            )
+        )
+        
+        # Input area placeholder
+        input_group = []
+        
+        if show_skip:
+            skip_text = Text()
+            skip_text.append("💡 ", style=self.theme.BOLD_ORANGE)
+            skip_text.append("Feeling we have enough info? Press ", style=self.theme.TEXT_DIM)
+            skip_text.append("Ctrl+D", style=self.theme.BOLD_ORANGE)
+            skip_text.append(" or ", style=self.theme.TEXT_DIM)
+            skip_text.append("ESC ESC", style=self.theme.BOLD_ORANGE)
+            skip_text.append(" to finish Q&A", style=self.theme.TEXT_DIM)
+            input_group.append(Align.center(skip_text))
+            input_group.append(Text())
+        
+        input_text = Text()
+        input_text.append("📝 ", style=self.theme.BOLD_ORANGE)
+        input_text.append("Type your answer below:", style=self.theme.WHITE)
+        input_group.append(Align.center(input_text))
+        input_group.append(Text())
+        
+        # Add placeholder for box
+        for _ in range(box_rows):
+            input_group.append(Text())
+        
+        layout["input_area"].update(
+            Panel(
+                Group(*input_group),
+                title=_panel_title("▶ YOUR ANSWER"),
+                border_style=self.theme.ORANGE,
+                box=HEAVY,
+                padding=(1, 2),
+                expand=True
+            )
+        )
+        
+        # Footer
+        layout["footer"].update(self._create_footer(""))
+        
+        return layout
     
     def ask_qa_input(
         self,
@@ -1554,10 +2048,6 @@ class RetroUI:
         Returns:
             Tuple of (answer, enough_signal) where enough_signal is True if user pressed Ctrl+\
         """
-        import termios
-        import tty
-        import textwrap
-        import sys
         
         # We'll handle Ctrl+\ directly as a character, no need for signal handler
         
@@ -1571,116 +2061,66 @@ class RetroUI:
         min_box_height = 3
         max_box_height = 10
         
-        def wrap_text(text: str) -> List[str]:
-            """Wrap text to fit inside box."""
-            if not text:
-                return [""]
-            return textwrap.wrap(text, width=inner_width) or [""]
-        
-        # Hide cursor during rendering
-        print('\033[?25l', end='', flush=True)
+        def line_offsets(text: str, lines: List[str]) -> List[int]:
+            """Start position in ``text`` of each of its wrapped ``lines``.
+            
+            textwrap drops the whole run of spaces at each break, so each
+            line is located in the text rather than assuming one space.
+            A line starts with a non-space, so it can't match inside the
+            run before it.
+            """
+            offsets = []
+            pos = 0
+            for line in lines:
+                pos = text.index(line, pos)
+                offsets.append(pos)
+                pos += len(line)
+            return offsets
+        
+        # The previous wrap, reused up to just before the first edited word
+        last_text = ""
+        last_lines = [""]
+        
+        def wrap_text(text: str, edit_from: int) -> List[str]:
+            """Wrap text to fit inside box.
+            
+            ``edit_from`` is the first position that may differ from the text
+            of the previous call; the lines before it are reused.
+            """
+            nonlocal last_text, last_lines
+            lines = None
+            if text and last_text and edit_from > 0:
+                # Greedy wrapping only changes lines from the one before the
+                # edited word (a shorter word can move up a line, and a long
+                # word is split starting on the line where it begins), so
+                # re-wrap from there, provided the kept lines really start
+                # where the offsets say
+                word_start = last_text.rfind(' ', 0, edit_from) + 1
+                offsets = line_offsets(last_text, last_lines)
+                keep = bisect.bisect_right(offsets, word_start) - 2
+                if keep > 0:
+                    start = offsets[keep]
+                    if last_text[start] != ' ' and last_text[:start] == ' '.join(last_lines[:keep]) + ' ':
+                        lines = last_lines[:keep] + textwrap.wrap(
+                            text[start:], width=inner_width, break_on_hyphens=False
+                        )
+            if lines is None:
+                lines = textwrap.wrap(text, width=inner_width, break_on_hyphens=False) or [""]
+            last_text, last_lines = text, lines
+            return lines
         
         try:
-            # Clear screen first
-            self._clear_screen()
-            
-            # Draw static layout first (header, question, footer)
-            # Create layout
-            layout = Layout()
-            
-            # Calculate dynamic sizes
+            # Clear the screen and draw the static layout (header, question,
+            # footer) in one write; the cursor stays hidden while typing
             question_area_size = max(8, (self.height - 20 - max_box_height) // 2)
             input_area_size = self.height - 9 - question_area_size - 3
             
-            layout.split_column(
-                Layout(name="header", size=9),
-                Layout(name="question", size=question_area_size),
-                Layout(name="input_area", size=input_area_size),
-                Layout(name="footer", size=3)
-            )
-            
-            # Header
-            layout["header"].update(
-                self._create_header(title, subtitle)
-            )
-            
-            # Question panel
-            question_group = []
-            cat_text = Text()
-            cat_text.append(f"Category: ", style=self.theme.TEXT_DIM)
-            cat_text.append(category.upper(), style=f"bold {self.theme.ORANGE}")
-            cat_text.append(f"  |  Question ", style=self.theme.TEXT_DIM)
-            cat_text.append(str(question_number), style=f"bold {self.theme.ORANGE}")
-            question_group.append(Align.center(cat_text))
-            question_group.append(Text())
-            
-            q_text = Text()
-            q_text.append("? ", style=f"bold {self.theme.ORANGE}")
-            wrapped_q = textwrap.fill(question, width=min(100, self.width - 20))
-            q_text.append(wrapped_q, style=f"bold {self.theme.WHITE}")
-            question_group.append(Align.center(q_text))
-            
-            layout["question"].update(
-                Panel(
-                    Align.center(Group(*question_group), vertical="middle"),
-                    border_style=self.theme.ORANGE_DARK,
-                    box=DOUBLE,
-                    padding=(1, 4),
-                    expand=True
-                )
-            )
-            
-            # Input area placeholder
-            input_group = []
-            
-            if question_number >= allow_skip_after:
-                skip_text = Text()
-                skip_text.append("💡 ", style=f"bold {self.theme.ORANGE}")
-                skip_text.append("Feeling we have enough info? Press ", style=self.theme.TEXT_DIM)
-                skip_text.append("Ctrl+D", style=f"bold {self.theme.ORANGE}")
-                skip_text.append(" or ", style=self.theme.TEXT_DIM)
-                skip_text.append("ESC ESC", style=f"bold {self.theme.ORANGE}")
-                skip_text.append(" to finish Q&A", style=self.theme.TEXT_DIM)
-                input_group.append(Align.center(skip_text))
-                input_group.append(Text())
-            
-            input_text = Text()
-            input_text.append("📝 ", style=f"bold {self.theme.ORANGE}")
-            input_text.append("Type your answer below:", style=self.theme.WHITE)
-            input_group.append(Align.center(input_text))
-            input_group.append(Text())
-            
-            # Add placeholder for box
-            for _ in range(max_box_height):
-                input_group.append(Text())
-            
-            layout["input_area"].update(
-                Panel(
-                    Group(*input_group),
-                    title=f"[{self.theme.ORANGE}]▶ YOUR ANSWER[/]",
-                    border_style=self.theme.ORANGE,
-                    box=HEAVY,
-                    padding=(1, 2),
-                    expand=True
-                )
+            self._draw_static_qa_frame(
+                title, subtitle, question, question_number, category,
+                question_number >= allow_skip_after,
+                question_area_size, input_area_size, max_box_height
             )
             
-            # Footer
-            footer_text = Text()
-            footer_text.append("Type and press ", style=self.theme.TEXT_DIM)
-            footer_text.append("ENTER", style=f"bold {self.theme.ORANGE}")
-            footer_text.append(" to submit | ", style=self.theme.TEXT_DIM)
-            if question_number >= allow_skip_after:
-                footer_text.append("Ctrl+D", style=f"bold {self.theme.ORANGE}")
-                footer_text.append(" = Enough info | ", style=self.theme.TEXT_DIM)
-            footer_text.append("Ctrl+C", style=f"bold {self.theme.ORANGE}")
-            footer_text.append(" = Cancel", style=self.theme.TEXT_DIM)
-            
-            layout["footer"].update(self._create_footer(""))
-            
-            # Print static layout
-            self.console.print(layout, style=f"on {self.theme.BACKGROUND}")
-            
             # Calculate box position on screen
             # Header (9) + question area + spacing in input panel
             box_start_row = 9 + question_area_size + 5
@@ -1690,164 +2130,141 @@ class RetroUI:
             # Center the box horizontally
             box_left_col = (self.width - box_width) // 2
             
-            # Get terminal settings
-            old_settings = termios.tcgetattr(sys.stdin)
-            tty.setraw(sys.stdin.fileno())
-            
             # Initial render
-            wrapped_lines = wrap_text(text)
+            wrapped_lines = wrap_text(text, 0)
+            offsets = line_offsets(text, wrapped_lines)
             cursor_line = 0
             cursor_col = 0
-            
-            def render_box():
-                """Render just the input box at its position."""
-                # Calculate box height
-                content_height = max(1, len(wrapped_lines))
-                box_height = min(max_box_height, max(min_box_height, content_height + 2))
-                
-                # Save cursor position
-                print('\033[s', end='', flush=True)
-                
-                # Move to box position
-                print(f'\033[{box_start_row};{box_left_col}H', end='', flush=True)
-                
-                # Draw box
-                # Top border
-                print(f"\033[38;2;218;119;86m╭{'─' * box_width}╮\033[0m", flush=True)
-                
-                # Content lines
+            # Box height and the first visible line only change on re-wrap
+            # or cursor moves, so relayout() keeps them up to date
+            box_height = min_box_height
+            visible_start = 0
+            
+            # Draws the box and remembers what is on screen
+            input_box = _InputBox(box_start_row, box_left_col, box_width, max_box_height)
+            
+            def relayout(edit_from: Optional[int]):
+                """Place the cursor on its wrapped line, re-wrapping if the text changed."""
+                nonlocal wrapped_lines, offsets, cursor_line, cursor_col, box_height, visible_start
+                if edit_from is not None:
+                    wrapped_lines = wrap_text(text, edit_from)
+                    offsets = line_offsets(text, wrapped_lines)
+                cursor_line = bisect.bisect_right(offsets, cursor_pos) - 1
+                # Past the end of the line inside a dropped run of spaces;
+                # keep the cursor within the box
+                cursor_col = min(cursor_pos - offsets[cursor_line], inner_width)
+                # Calculate box height and scroll the cursor line into view
+                box_height = min(max_box_height, max(min_box_height, len(wrapped_lines) + 2))
                 visible_start = max(0, cursor_line - (box_height - 3))
-                visible_end = min(len(wrapped_lines), visible_start + (box_height - 2))
-                
-                for i in range(box_height - 2):
-                    line_idx = visible_start + i
-                    print(f'\033[{box_start_row + i + 1};{box_left_col}H', end='', flush=True)
-                    
-                    if line_idx < len(wrapped_lines):
-                        line_text = wrapped_lines[line_idx]
-                        # Show cursor on current line
-                        if line_idx == cursor_line:
-                            if cursor_col < len(line_text):
-                                display_line = line_text[:cursor_col] + "█" + line_text[cursor_col:]
-                            else:
-                                display_line = line_text + "█"
-                        else:
-                            display_line = line_text
-                        
-                        # Pad line to box width
-                        padding_needed = box_width - len(display_line) - 2
-                        display_text = f"{display_line}{' ' * padding_needed}"
-                        print(f"\033[38;2;218;119;86m│ \033[0m{display_text}\033[38;2;218;119;86m │\033[0m", flush=True)
-                    else:
-                        # Empty line
-                        if line_idx == cursor_line:
-                            print(f"\033[38;2;218;119;86m│ \033[0m█{' ' * (box_width - 2)}\033[38;2;218;119;86m │\033[0m", flush=True)
-                        else:
-                            print(f"\033[38;2;218;119;86m│{' ' * (box_width + 2)}│\033[0m", flush=True)
-                
-                # Clear any extra lines below the box
-                for i in range(box_height - 2, max_box_height - 2):
-                    print(f'\033[{box_start_row + i + 1};{box_left_col}H', end='', flush=True)
-                    print(' ' * (box_width + 4), flush=True)
-                
-                # Bottom border
-                print(f'\033[{box_start_row + box_height - 1};{box_left_col}H', end='', flush=True)
-                print(f"\033[38;2;218;119;86m╰{'─' * box_width}╯\033[0m", flush=True)
-                
-                # Restore cursor position
-                print('\033[u', end='', flush=True)
             
-            # Initial box render
-            render_box()
+            can_skip = question_number >= allow_skip_after
             
-            while True:
-                # Read single character
-                char = sys.stdin.read(1)
-                
-                if char == '\r' or char == '\n':  # Enter - submit
-                    return text, False
-                
-                elif char == '\x1b':  # Escape sequence
-                    next_chars = sys.stdin.read(2)
-                    if next_chars == '[D':  # Left arrow
-                        if cursor_pos > 0:
-                            cursor_pos -= 1
-                    elif next_chars == '[C':  # Right arrow
-                        if cursor_pos < len(text):
-                            cursor_pos += 1
-                    elif next_chars == '[A':  # Up arrow
-                        # Move up a line
-                        if cursor_line > 0:
-                            cursor_line -= 1
-                            # Adjust cursor position
-                            line_start = sum(len(wrapped_lines[i]) + 1 for i in range(cursor_line))
-                            cursor_pos = min(line_start + cursor_col, len(text))
-                    elif next_chars == '[B':  # Down arrow
-                        # Move down a line
-                        if cursor_line < len(wrapped_lines) - 1:
-                            cursor_line += 1
-                            # Adjust cursor position
-                            line_start = sum(len(wrapped_lines[i]) + 1 for i in range(cursor_line))
-                            cursor_pos = min(line_start + cursor_col, len(text))
-                    elif next_chars == '\x1b':  # ESC ESC - double escape to skip
-                        if question_number >= allow_skip_after:
-                            return "", True
-                
-                elif char == '\x7f' or char == '\x08':  # Backspace
-                    if cursor_pos > 0:
-                        text = text[:cursor_pos-1] + text[cursor_pos:]
-                        cursor_pos -= 1
-                
-                elif char == '\x04':  # Ctrl+D - alternative skip key
-                    if question_number >= allow_skip_after:
-                        return "", True
-                
-                elif char == '\x1c':  # Ctrl+\ 
-                    if question_number >= allow_skip_after:
-                        return "", True
-                
-                elif char == '\x03':  # Ctrl+C
-                    raise KeyboardInterrupt()
+            with _raw_mode():
+                # Initial box render
+                _write_stdout(input_box.render(wrapped_lines, cursor_line, cursor_col, box_height, visible_start))
                 
-                elif 32 <= ord(char) <= 126:  # Printable characters
-                    text = text[:cursor_pos] + char + text[cursor_pos:]
-                    cursor_pos += 1
-                
-                # Re-wrap text and update cursor position
-                wrapped_lines = wrap_text(text)
-                
-                # Calculate cursor line and column from cursor position
-                remaining_pos = cursor_pos
-                cursor_line = 0
-                cursor_col = 0
-                
-                for i, line in enumerate(wrapped_lines):
-                    if remaining_pos <= len(line):
-                        cursor_line = i
-                        cursor_col = remaining_pos
-                        break
-                    remaining_pos -= len(line)
-                    # Account for implicit newline between wrapped lines
-                    if remaining_pos > 0:
-                        remaining_pos -= 1
-                
-                # Always re-render the box
-                render_box()
+                # Each read drains everything available (a whole paste at
+                # once); the keys are applied in order and the box is
+                # redrawn once per read, re-wrapped only if the text changed
+                # (not for cursor moves). An escape sequence cut off at the
+                # end of a read is kept for the next one.
+                pending = b''
+                while True:
+                    buf = pending + _read_bytes(4096)
+                    pending = b''
+                    # First position edited during this read, if any
+                    edit_from = None
+                    moved = False
+                    i, n = 0, len(buf)
+                    while i < n:
+                        byte = buf[i]
+                        i += 1
+                        
+                        if byte in (0x0d, 0x0a):  # Enter - submit
+                            return text, False
+                        
+                        elif byte == 0x1b:  # Escape sequence
+                            if i == n:
+                                pending = buf[i - 1:]
+                                break
+                            if buf[i] == 0x1b:  # ESC ESC - double escape to skip
+                                i += 1
+                                if can_skip:
+                                    return "", True
+                                continue
+                            if buf[i] != 0x5b:  # Not CSI: drop the lone ESC
+                                continue
+                            # CSI: parameters up to a final byte in 0x40-0x7E
+                            end = i + 1
+                            while end < n and not 0x40 <= buf[end] <= 0x7e:
+                                end += 1
+                            if end == n:
+                                pending = buf[i - 1:]
+                                break
+                            final = buf[end]
+                            i = end + 1
+                            if final == 0x44:  # Left arrow
+                                if cursor_pos > 0:
+                                    cursor_pos -= 1
+                                    moved = True
+                            elif final == 0x43:  # Right arrow
+                                if cursor_pos < len(text):
+                                    cursor_pos += 1
+                                    moved = True
+                            elif final in (0x41, 0x42):  # Up / down arrow
+                                # Line moves need the current wrap
+                                if edit_from is not None or moved:
+                                    relayout(edit_from)
+                                    edit_from, moved = None, False
+                                if final == 0x41 and cursor_line > 0:
+                                    cursor_line -= 1
+                                elif final == 0x42 and cursor_line < len(wrapped_lines) - 1:
+                                    cursor_line += 1
+                                else:
+                                    continue
+                                # Adjust cursor position
+                                cursor_pos = min(offsets[cursor_line] + cursor_col, len(text))
+                                moved = True
+                        
+                        elif byte in (0x7f, 0x08):  # Backspace
+                            if cursor_pos > 0:
+                                text = text[:cursor_pos-1] + text[cursor_pos:]
+                                cursor_pos -= 1
+                                if edit_from is None or cursor_pos < edit_from:
+                                    edit_from = cursor_pos
+                        
+                        elif byte in (0x04, 0x1c):  # Ctrl+D / Ctrl+\ - enough info
+                            if can_skip:
+                                return "", True
+                        
+                        elif byte == 0x03:  # Ctrl+C
+                            raise KeyboardInterrupt()
+                        
+                        elif 32 <= byte <= 126:  # Printable characters
+                            # Insert the whole run of printables at once
+                            start = i - 1
+                            while i < n and 32 <= buf[i] <= 126:
+                                i += 1
+                            chunk = buf[start:i].decode('ascii')
+                            if cursor_pos == len(text):
+                                # Typing at the end (the usual case) needs
+                                # no slicing
+                                text += chunk
+                            else:
+                                text = text[:cursor_pos] + chunk + text[cursor_pos:]
+                            if edit_from is None or cursor_pos < edit_from:
+                                edit_from = cursor_pos
+                            cursor_pos += i - start
+                    
+                    if edit_from is not None or moved:
+                        relayout(edit_from)
+                        _write_stdout(input_box.render(wrapped_lines, cursor_line, cursor_col, box_height, visible_start))
                 
-        except KeyboardInterrupt:
-            raise
-            
         finally:
-            # Restore terminal settings
-            termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
-            print('\033[?25h', end='', flush=True)  # Show cursor
+            _write_stdout(self._cursor(True))
     
     def show_specification_sections(self, title: str, sections: Dict[str, str], subtitle: str = "") -> None:
         """Show specification sections with scrolling support."""
-        import textwrap
-        import sys
-        import tty
-        import termios
         
         # Prepare all content lines
         all_lines = []
@@ -1868,115 +2285,117 @@ class RetroUI:
         current_line = 0
         content_height = self.height - 15  # Account for header and footer
         
-        while True:
-            self._clear_screen()
-            
-            # Create layout
-            layout = Layout()
-            layout.split_column(
-                Layout(name="header", size=9),
-                Layout(name="content", ratio=1),
-                Layout(name="footer", size=4)
-            )
-            
-            # Header
-            layout["header"].update(
-                self._create_header(title, subtitle)
-            )
-            
-            # Get visible lines
-            visible_lines = all_lines[current_line:current_line + content_height]
-            
-            # Create content text
-            content_texts = []
-            for i, line in enumerate(visible_lines):
-                if line.startswith("▶ "):
-                    # Section title
-                    text = Text(line, style=f"bold {self.theme.ORANGE}")
-                elif line.startswith("─"):
-                    # Separator
-                    text = Text(line, style=self.theme.ORANGE_DARK)
-                else:
-                    # Regular content
-                    text = Text(line, style=self.theme.WHITE)
-                content_texts.append(text)
-            
-            # Fill remaining space with empty lines
-            for _ in range(content_height - len(visible_lines)):
-                content_texts.append(Text(""))
-            
-            content_group = Group(*content_texts)
-            
-            layout["content"].update(
-                Panel(
-                    content_group,
-                    title=f"[{self.theme.ORANGE}]▶ DETAILS[/]",
-                    border_style=self.theme.ORANGE,
-                    box=HEAVY,
-                    padding=(1, 2),
-                    expand=True
-                )
-            )
-            
-            # Footer with scroll indicators
-            footer_text = Text()
-            
-            # Scroll position indicator
-            if len(all_lines) > content_height:
-                scroll_percent = int((current_line / max(1, len(all_lines) - content_height)) * 100)
-                footer_text.append(f"Line {current_line + 1}-{min(current_line + content_height, len(all_lines))} of {len(all_lines)} ({scroll_percent}%)\n", 
-                                 style=self.theme.TEXT_DIM)
-            
-            # Navigation hints
-            if current_line > 0:
-                footer_text.append("↑ ", style=f"bold {self.theme.ORANGE}")
-                footer_text.append("Scroll up  ", style=self.theme.TEXT_DIM)
-            
-            if current_line + content_height < len(all_lines):
-                footer_text.append("↓ ", style=f"bold {self.theme.ORANGE}")
-                footer_text.append("Scroll down  ", style=self.theme.TEXT_DIM)
-            
-            footer_text.append("ENTER ", style=f"bold {self.theme.ORANGE}")
-            footer_text.append("Continue  ", style=self.theme.TEXT_DIM)
-            
-            footer_text.append("PAGE UP/DOWN ", style=f"bold {self.theme.ORANGE}")
-            footer_text.append("Page scroll", style=self.theme.TEXT_DIM)
-            
-            layout["footer"].update(
-                Align.center(footer_text)
-            )
-            
-            # Print layout
-            self.console.print(layout, style=f"on {self.theme.BACKGROUND}")
-            
-            # Handle input
-            old_settings = termios.tcgetattr(sys.stdin)
-            try:
-                tty.setraw(sys.stdin.fileno())
-                key = sys.stdin.read(1)
+        # The header is the same for every scroll position
+        layout = Layout()
+        layout.split_column(
+            Layout(name="header", size=9),
+            Layout(name="content", ratio=1),
+            Layout(name="footer", size=4)
+        )
+        layout["header"].update(
+            self._create_header(title, subtitle)
+        )
+        
+        # Keys that leave the scroll position where it is do not redraw
+        drawn = None
+        # Escape sequence cut off at the end of the last read
+        pending = b''
+        with _raw_mode():
+            while True:
+                if current_line != drawn:
+                    # Get visible lines
+                    visible_lines = all_lines[current_line:current_line + content_height]
+                    
+                    # Create content text
+                    content_texts = []
+                    for i, line in enumerate(visible_lines):
+                        if line.startswith("▶ "):
+                            # Section title
+                            text = Text(line, style=self.theme.BOLD_ORANGE)
+                        elif line.startswith("─"):
+                            # Separator
+                            text = Text(line, style=self.theme.ORANGE_DARK)
+                        else:
+                            # Regular content
+                            text = Text(line, style=self.theme.WHITE)
+                        content_texts.append(text)
+                    
+                    # Fill remaining space with empty lines
+                    for _ in range(content_height - len(visible_lines)):
+                        content_texts.append(Text(""))
+                    
+                    content_group = Group(*content_texts)
+                    
+                    layout["content"].update(
+                        Panel(
+                            content_group,
+                            title=_panel_title("▶ DETAILS"),
+                            border_style=self.theme.ORANGE,
+                            box=HEAVY,
+                            padding=(1, 2),
+                            expand=True
+                        )
+                    )
+                    
+                    # Footer with scroll indicators
+                    footer_text = Text()
+                    
+                    # Scroll position indicator
+                    if len(all_lines) > content_height:
+                        scroll_percent = int((current_line / max(1, len(all_lines) - content_height)) * 100)
+                        footer_text.append(f"Line {current_line + 1}-{min(current_line + content_height, len(all_lines))} of {len(all_lines)} ({scroll_percent}%)\n", 
+                                         style=self.theme.TEXT_DIM)
+                    
+                    # Navigation hints
+                    if current_line > 0:
+                        footer_text.append("↑ ", style=self.theme.BOLD_ORANGE)
+                        footer_text.append("Scroll up  ", style=self.theme.TEXT_DIM)
+                    
+                    if current_line + content_height < len(all_lines):
+                        footer_text.append("↓ ", style=self.theme.BOLD_ORANGE)
+                        footer_text.append("Scroll down  ", style=self.theme.TEXT_DIM)
+                    
+                    footer_text.append("ENTER ", style=self.theme.BOLD_ORANGE)
+                    footer_text.append("Continue  ", style=self.theme.TEXT_DIM)
+                    
+                    footer_text.append("PAGE UP/DOWN ", style=self.theme.BOLD_ORANGE)
+                    footer_text.append("Page scroll", style=self.theme.TEXT_DIM)
+                    
+                    layout["footer"].update(
+                        Align.center(footer_text)
+                    )
+                    
+                    # Clear and print in one write
+                    self._print_frame(layout, prefix=self._cursor(False) + _CLEAR_SCREEN)
+                    drawn = current_line
                 
-                if key == '\r' or key == '\n':  # Enter - exit
-                    break
-                elif key == '\x1b':  # Escape sequence
-                    next_keys = sys.stdin.read(2)
-                    if next_keys == '[A' and current_line > 0:  # Up arrow
+                # Handle input; a read can hold several keys
+                buf = pending + _read_bytes()
+                pending = b''
+                i = 0
+                while i < len(buf):
+                    length = _key_length(buf, i)
+                    if not length:
+                        pending = buf[i:]
+                        break
+                    key = buf[i:i + length]
+                    i += length
+                    
+                    if key == b'\r' or key == b'\n':  # Enter - exit
+                        return
+                    elif key == b'\x1b[A' and current_line > 0:  # Up arrow
                         current_line -= 1
-                    elif next_keys == '[B' and current_line + content_height < len(all_lines):  # Down arrow
+                    elif key == b'\x1b[B' and current_line + content_height < len(all_lines):  # Down arrow
                         current_line += 1
-                    elif next_keys == '[5':  # Page Up
-                        sys.stdin.read(1)  # consume ~
+                    elif key == b'\x1b[5~':  # Page Up
                         current_line = max(0, current_line - content_height)
-                    elif next_keys == '[6':  # Page Down
-                        sys.stdin.read(1)  # consume ~
-                        current_line = min(len(all_lines) - content_height, current_line + content_height)
-                elif key == ' ':  # Spacebar - page down
-                    if current_line + content_height < len(all_lines):
+                    elif key == b'\x1b[6~':  # Page Down
                         current_line = min(len(all_lines) - content_height, current_line + content_height)
-                elif key == 'b' or key == 'B':  # B - page up
-                    current_line = max(0, current_line - content_height)
-                    
-            finally:
-                termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
+                    elif key == b' ':  # Spacebar - page down
+                        if current_line + content_height < len(all_lines):
+                            current_line = min(len(all_lines) - content_height, current_line + content_height)
+                    elif key == b'b' or key == b'B':  # B - page up
+                        current_line = max(0, current_line - content_height)
     
     def show_qa_progress(self, message: str = "Generating next question...", duration: float = 0):
         """Show a progress screen while generating Q&A questions.
@@ -1985,14 +2404,8 @@ class RetroUI:
             message: The message to display
             duration: If > 0, show animated progress for this many seconds
         """
-        import threading
-        import time
-        from rich.live import Live
-        
-        # Clear screen and immediately show static progress
-        self._clear_screen()
         
-        # Create static progress layout
+        # Create progress layout
         layout = Layout()
         layout.split_column(
             Layout(name="header", size=9),
@@ -2005,110 +2418,87 @@ class RetroUI:
             self._create_header("Q&A SESSION", "Claude is thinking...")
         )
         
-        # Progress content
-        progress_group = []
-        
-        # Message
-        msg_text = Text(f"\n{message}\n", style=f"bold {self.theme.WHITE}")
-        progress_group.append(Align.center(msg_text))
-        
-        # Static Claude art
-        claude_art = Text()
-        claude_art.append("\n     🤖\n", style=f"bold {self.theme.ORANGE}")
-        claude_art.append("    /│\\\n", style=self.theme.ORANGE_LIGHT)
-        claude_art.append("   / │ \\\n", style=self.theme.ORANGE_LIGHT)
-        progress_group.append(Align.center(claude_art))
-        
-        # Loading animation
-        loading_text = Text()
-        loading_text.append("\n◆ ◇ ◆ ◇ ◆ ◇ ◆\n", style=f"bold {self.theme.ORANGE}")
-        progress_group.append(Align.center(loading_text))
-        
-        # Status
-        status_text = Text()
-        status_text.append("\nAnalyzing previous answers...\n", style=self.theme.TEXT_DIM)
-        status_text.append("Formulating contextual question...\n", style=self.theme.TEXT_DIM)
-        progress_group.append(Align.center(status_text))
-        
-        content = Panel(
-            Align.center(Group(*progress_group), vertical="middle"),
-            title=f"[{self.theme.ORANGE}]◆ PROCESSING ◆[/]",
-            border_style=self.theme.ORANGE,
-            box=HEAVY,
-            padding=(2, 4)
-        )
-        
-        layout["content"].update(
-            Align.center(content, vertical="middle")
-        )
-        
         # Footer
         layout["footer"].update(
             self._create_footer("Please wait...")
         )
         
-        # Show the static progress immediately
-        self.console.print(layout, style=f"on {self.theme.BACKGROUND}", height=self.height)
+        def set_progress(robot: str, loading: str) -> None:
+            """Put the progress panel for one animation frame in the layout."""
+            progress_group = []
+            
+            # Message
+            msg_text = Text(f"\n{message}\n", style=self.theme.BOLD_WHITE)
+            progress_group.append(Align.center(msg_text))
+            
+            # Claude thinking
+            claude_art = Text()
+            claude_art.append(f"\n     {robot}\n", style=self.theme.BOLD_ORANGE)
+            claude_art.append("    /│\\\n", style=self.theme.ORANGE_LIGHT)
+            claude_art.append("   / │ \\\n", style=self.theme.ORANGE_LIGHT)
+            progress_group.append(Align.center(claude_art))
+            
+            # Loading animation
+            loading_text = Text()
+            loading_text.append(f"\n{loading}\n", style=self.theme.BOLD_ORANGE)
+            progress_group.append(Align.center(loading_text))
+            
+            # Status
+            status_text = Text()
+            status_text.append("\nAnalyzing previous answers...\n", style=self.theme.TEXT_DIM)
+            status_text.append("Formulating contextual question...\n", style=self.theme.TEXT_DIM)
+            progress_group.append(Align.center(status_text))
+            
+            content = self._create_progress_panel(*progress_group)
+            
+            layout["content"].update(
+                Align.center(content, vertical="middle")
+            )
+        
+        # Clear the screen and show the static progress immediately, in one write
+        set_progress("🤖", "◆ ◇ ◆ ◇ ◆ ◇ ◆")
+        static_frame = self._render_frame(layout, height=self.height)
+        _write_stdout(self._cursor(False) + _CLEAR_SCREEN + static_frame)
         
-        # Only animate if duration > 0
-        if duration > 0:
+        # Only animate if duration > 0, and only on a terminal
+        if duration > 0 and self._stdout_isatty:
             self.loading_active = True
-            frame_index = 0
+            self._stop_event.clear()
             
             loading_frames = ["◆ ◇ ◆ ◇ ◆ ◇ ◆", "◇ ◆ ◇ ◆ ◇ ◆ ◇", "◆ ◇ ◆ ◇ ◆ ◇ ◆", "◇ ◆ ◇ ◆ ◇ ◆ ◇"]
             robot_frames = ["🤖", "🤖", "🤖", "🤖"]
             
-            def generate_frame():
-                nonlocal frame_index
-                
-                # Reuse the same layout structure but update animations
-                progress_group = []
-                
-                # Message
-                msg_text = Text(f"\n{message}\n", style=f"bold {self.theme.WHITE}")
-                progress_group.append(Align.center(msg_text))
-                
-                # Animated Claude thinking
-                claude_art = Text()
-                claude_art.append(f"\n     {robot_frames[frame_index % len(robot_frames)]}\n", style=f"bold {self.theme.ORANGE}")
-                claude_art.append("    /│\\\n", style=self.theme.ORANGE_LIGHT)
-                claude_art.append("   / │ \\\n", style=self.theme.ORANGE_LIGHT)
-                progress_group.append(Align.center(claude_art))
-                
-                # Loading animation
-                loading_text = Text()
-                loading_text.append(f"\n{loading_frames[frame_index % len(loading_frames)]}\n", style=f"bold {self.theme.ORANGE}")
-                progress_group.append(Align.center(loading_text))
-                
-                # Status
-                status_text = Text()
-                status_text.append("\nAnalyzing previous answers...\n", style=self.theme.TEXT_DIM)
-                status_text.append("Formulating contextual question...\n", style=self.theme.TEXT_DIM)
-                progress_group.append(Align.center(status_text))
-                
-                content = Panel(
-                    Align.center(Group(*progress_group), vertical="middle"),
-                    title=f"[{self.theme.ORANGE}]◆ PROCESSING ◆[/]",
-                    border_style=self.theme.ORANGE,
-                    box=HEAVY,
-                    padding=(2, 4)
-                )
-                
-                layout["content"].update(
-                    Align.center(content, vertical="middle")
-                )
-                
-                frame_index += 1
-                return layout
+            # Screen lines of each animation frame, rendered by Rich the
+            # first time the frame comes up and reused after that
+            frame_lines: Dict[int, List[str]] = {}
             
-            # Animate with lower refresh rate
             def animate():
+                frame_index = 0
+                painted = static_frame.decode().split("\n")
                 end_time = time.time() + duration
-                while self.loading_active and time.time() < end_time:
-                    # Move cursor to home and update
-                    print('\033[H', end='', flush=True)
-                    self.console.print(generate_frame(), style=f"on {self.theme.BACKGROUND}", height=self.height)
-                    time.sleep(0.5)  # Lower refresh rate
+                while time.time() < end_time:
+                    key = frame_index % len(loading_frames)
+                    lines = frame_lines.get(key)
+                    if lines is None:
+                        set_progress(robot_frames[key % len(robot_frames)], loading_frames[key])
+                        lines = self._render_frame(layout, height=self.height).decode().split("\n")
+                        frame_lines[key] = lines
+                    
+                    # Only rewrite the screen lines that differ from what is
+                    # already there (in practice just the loading dots)
+                    changed = [
+                        f"\033[{row + 1};1H{line}"
+                        for row, (line, old) in enumerate(zip(lines, painted))
+                        if line != old
+                    ]
+                    if changed:
+                        _write_stdout("".join(changed).encode())
+                    painted = lines
+                    
+                    frame_index += 1
+                    # Two frames a second; stop_qa_progress ends the wait early
+                    if self._stop_event.wait(0.5):
+                        break
             
             # Start animation in background
             self.animation_thread = threading.Thread(target=animate, daemon=True)
@@ -2116,8 +2506,8 @@ class RetroUI:
     
     def stop_qa_progress(self):
         """Stop the Q&A progress animation if running."""
-        if hasattr(self, 'loading_active'):
-            self.loading_active = False
+        self.loading_active = False
+        self._stop_event.set()
         if hasattr(self, 'animation_thread'):
             self.animation_thread.join(timeout=0.5)
         # Clear screen to prepare for next display
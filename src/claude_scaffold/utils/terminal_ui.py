@@ -1,9 +1,12 @@
 """Enhanced terminal UI components using Rich."""
 
-from typing import Any, Dict, List, Optional
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import cached_property, partialmethod
+from itertools import islice
+from typing import Any, Deque, Dict, Iterator, List, Optional
 
-import questionary
-from questionary import Style as QStyle
 from rich.box import MINIMAL
 from rich.console import Console
 from rich.layout import Layout
@@ -14,45 +17,72 @@ from rich.text import Text
 from .icons import icons
 
 
+@dataclass(frozen=True, slots=True)
+class MessageStyle:
+    """Icon, border style and title of a kind of message."""
+
+    icon: str
+    border_style: str
+    title: str
+    # Styled "<icon> " that starts every message of this kind; copied per message
+    prefix: Text = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "prefix", Text.assemble((f"{self.icon} ", "bold")))
+
+
 class MessageType:
     """Message types with their corresponding styles and icons."""
 
-    CLAUDE_QUESTION = {
-        "icon": "🤖",
-        "border_style": "bright_black",
-        "title": "Claude",
-    }
-    CLAUDE_SUGGESTION = {
-        "icon": "💡",
-        "border_style": "bright_black",
-        "title": "Suggestion",
-    }
-    CLAUDE_RESPONSE = {
-        "icon": "🤖",
-        "border_style": "bright_black",
-        "title": "Claude",
-    }
-    USER_MESSAGE = {"icon": "👤", "border_style": "bright_black", "title": "You"}
-    ERROR_MESSAGE = {"icon": "❌", "border_style": "red", "title": "Error"}
-    INFO_MESSAGE = {"icon": "ℹ️", "border_style": "bright_black", "title": "Info"}
-    SUCCESS_MESSAGE = {
-        "icon": "✅",
-        "border_style": "green",
-        "title": "Success",
-    }
+    CLAUDE_QUESTION = MessageStyle(icon="🤖", border_style="bright_black", title="Claude")
+    CLAUDE_SUGGESTION = MessageStyle(icon="💡", border_style="bright_black", title="Suggestion")
+    CLAUDE_RESPONSE = MessageStyle(icon="🤖", border_style="bright_black", title="Claude")
+    USER_MESSAGE = MessageStyle(icon="👤", border_style="bright_black", title="You")
+    ERROR_MESSAGE = MessageStyle(icon="❌", border_style="red", title="Error")
+    INFO_MESSAGE = MessageStyle(icon="ℹ️", border_style="bright_black", title="Info")
+    SUCCESS_MESSAGE = MessageStyle(icon="✅", border_style="green", title="Success")
 
 
 class EnhancedTerminalUI:
     """Enhanced terminal UI with fixed input box and styled messages."""
 
     def __init__(self):
-        self.console = Console()
-        self.messages: List[Dict[str, Any]] = []
+        # Messages are built from Text objects, so markup parsing and the
+        # automatic highlighter are not needed
+        self.console = Console(highlight=False, markup=False, emoji=False, log_time=False)
+        # Only the last 20 messages are shown, so older ones are dropped
+        self.messages: Deque[Dict[str, Any]] = deque(maxlen=20)
+        # The conversation panel is rebuilt lazily, once per redraw, however
+        # many messages were added since the last one
+        self._conversation_dirty = False
+        # The table currently shown, how many messages it holds and how many
+        # were added since it was last updated
+        self._conversation_table: Optional[Table] = None
+        self._conversation_rows = 0
+        self._unshown_messages = 0
+        # Rows of the frame last drawn by refresh(), or None once anything
+        # else may have written to the screen
+        self._painted_lines: Optional[List[str]] = None
+        self._painted_width = 0
         self.layout = Layout()
         self._setup_layout()
 
-        # Minimal questionary style matching Claude Code
-        self.qstyle = QStyle(
+        # questionary (and prompt_toolkit under it) is slow to import and only
+        # needed once a prompt is shown, so it is imported on first use
+        self._q = None
+
+    def _questionary(self):
+        """Return the questionary module, importing it on first use."""
+        if self._q is None:
+            import questionary
+
+            self._q = questionary
+        return self._q
+
+    @cached_property
+    def qstyle(self):
+        """Minimal questionary style matching Claude Code."""
+        return self._questionary().Style(
             [
                 ("qmark", "fg:#666666"),
                 ("question", ""),
@@ -100,47 +130,122 @@ class EnhancedTerminalUI:
             Panel(input_content, border_style="bright_black", box=MINIMAL, padding=(0, 1))
         )
 
-    def add_message(self, content: str, message_type: Dict[str, str]):
+    def add_message(self, content: str, message_type: MessageStyle):
         """Add a message to the conversation history."""
         self.messages.append({"content": content, "type": message_type})
-        self._update_conversation_display()
-
-    def _update_conversation_display(self):
-        """Update the conversation display with all messages."""
-        # Create a table for messages
-        table = Table(show_header=False, show_edge=False, pad_edge=False, box=MINIMAL)
-        table.add_column("Messages", style="white")
+        self._unshown_messages += 1
+        self._conversation_dirty = True
 
-        # Add all messages
-        for msg in self.messages[-20:]:  # Show last 20 messages
+    def _message_panel(self, msg: Dict[str, Any]) -> Panel:
+        """Return the panel for a message, building it the first time."""
+        panel = msg.get("panel")
+        if panel is None:
             msg_type = msg["type"]
 
             # Create message panel
-            content = Text()
-            content.append(f"{msg_type['icon']} ", style="bold")
+            content = msg_type.prefix.copy()
             content.append(msg["content"])
 
-            panel = Panel(
+            panel = msg["panel"] = Panel(
                 content,
-                border_style=msg_type["border_style"],
+                border_style=msg_type.border_style,
                 box=MINIMAL,
                 padding=(0, 1),
             )
+        return panel
 
-            table.add_row(panel)
+    def _update_conversation_display(self):
+        """Update the conversation display with all messages."""
+        unshown = self._unshown_messages
+        if self._conversation_table is None or self._conversation_rows + unshown > 20:
+            # Create a table for messages; once the window slides, the oldest
+            # rows have to go, so it is rebuilt from the cached panels
+            table = Table(show_header=False, show_edge=False, pad_edge=False, box=MINIMAL)
+            table.add_column("Messages", style="white")
+            self._conversation_table = table
+            new_messages = iter(self.messages)
+
+            # Update the conversation layout
+            self.layout["conversation"].update(
+                Panel(table, border_style="dim", box=MINIMAL, padding=(0, 1))
+            )
+        else:
+            # Until then only the messages added since the last update are new
+            table = self._conversation_table
+            new_messages = islice(self.messages, len(self.messages) - unshown, None)
+
+        for msg in new_messages:
+            table.add_row(self._message_panel(msg))
             table.add_row("")  # Empty row for spacing
+        self._conversation_rows = len(self.messages)
+        self._unshown_messages = 0
 
-        # Update the conversation layout
-        self.layout["conversation"].update(
-            Panel(table, border_style="dim", box=MINIMAL, padding=(0, 1))
-        )
+    def _sync_layout(self):
+        """Bring the conversation panel up to date with the messages."""
+        if self._conversation_dirty:
+            self._conversation_dirty = False
+            self._update_conversation_display()
 
     def display(self):
         """Display the layout."""
+        self._sync_layout()
+        self._painted_lines = None
         self.console.print(self.layout)
 
+    def refresh(self):
+        """Redraw the layout over the previous frame.
+
+        The layout fills the screen but its last row, so instead of clearing
+        first it is rendered off-screen and written from the home position,
+        overdrawing the old frame; anything left below it is erased. When
+        the previous frame is still on screen, only the rows that changed
+        are rewritten.
+        """
+        self._sync_layout()
+        if not self.console.is_terminal:
+            self.display()
+            return
+        # One row short of the screen, so the final newline never scrolls it
+        # and every frame row stays on the same screen row
+        width = self.console.width
+        with self.console.capture() as capture:
+            self.console.print(self.layout, height=self.console.height - 1)
+        frame = capture.get()
+        lines = frame.split("\n")
+
+        painted = self._painted_lines
+        if painted is None or len(painted) != len(lines) or self._painted_width != width:
+            output = f"\x1b[H{frame}\x1b[J"
+        else:
+            changed = [
+                f"\x1b[{row};1H{line}"
+                for row, (line, old) in enumerate(zip(lines, painted), 1)
+                if line != old
+            ]
+            # Leave the cursor on the free last row, as a full redraw does
+            output = "".join(changed) + f"\x1b[{len(lines)};1H\x1b[J"
+        self._painted_lines = lines
+        self._painted_width = width
+
+        self.console.file.write(output)
+        self.console.file.flush()
+
+    @contextmanager
+    def external_output(self) -> Iterator[None]:
+        """Let other code write to the screen, such as a progress display.
+
+        Whatever it writes may scroll or overwrite the last frame, so the next
+        ``refresh()`` redraws every row instead of only the changed ones.
+        """
+        self._painted_lines = None
+        try:
+            yield
+        finally:
+            self._painted_lines = None
+
     def clear_screen(self):
         """Clear the terminal screen."""
+        self._painted_lines = None
         self.console.clear()
 
     def ask_question(self, question: str, choices: Optional[List[str]] = None) -> str:
@@ -148,18 +253,19 @@ class EnhancedTerminalUI:
         # Add the question to conversation
         self.add_message(question, MessageType.CLAUDE_QUESTION)
 
-        # Clear and redisplay
-        self.clear_screen()
-        self.display()
+        # Redraw in place
+        self.refresh()
 
         # Update input area
         self._update_input_area("Type your answer below...")
 
         # Use questionary for input
-        if choices:
-            answer = questionary.select(question, choices=choices, style=self.qstyle).ask()
-        else:
-            answer = questionary.text(question, style=self.qstyle).ask()
+        questionary = self._questionary()
+        with self.external_output():
+            if choices:
+                answer = questionary.select(question, choices=choices, style=self.qstyle).ask()
+            else:
+                answer = questionary.text(question, style=self.qstyle).ask()
 
         # Add user answer to conversation
         if answer:
@@ -167,43 +273,25 @@ class EnhancedTerminalUI:
 
         return answer
 
-    def show_suggestion(self, suggestion: str):
-        """Show a suggestion from Claude."""
-        self.add_message(suggestion, MessageType.CLAUDE_SUGGESTION)
-        self.clear_screen()
-        self.display()
-
-    def show_response(self, response: str):
-        """Show a response from Claude."""
-        self.add_message(response, MessageType.CLAUDE_RESPONSE)
-        self.clear_screen()
-        self.display()
-
-    def show_error(self, error: str):
-        """Show an error message."""
-        self.add_message(error, MessageType.ERROR_MESSAGE)
-        self.clear_screen()
-        self.display()
-
-    def show_info(self, info: str):
-        """Show an info message."""
-        self.add_message(info, MessageType.INFO_MESSAGE)
-        self.clear_screen()
-        self.display()
-
-    def show_success(self, message: str):
-        """Show a success message."""
-        self.add_message(message, MessageType.SUCCESS_MESSAGE)
-        self.clear_screen()
-        self.display()
+    def _emit(self, content: str, message_type: MessageStyle):
+        """Add a message of the given type and redraw."""
+        self.add_message(content, message_type)
+        self.refresh()
+
+    # Show a suggestion, response, error, info or success message
+    show_suggestion = partialmethod(_emit, message_type=MessageType.CLAUDE_SUGGESTION)
+    show_response = partialmethod(_emit, message_type=MessageType.CLAUDE_RESPONSE)
+    show_error = partialmethod(_emit, message_type=MessageType.ERROR_MESSAGE)
+    show_info = partialmethod(_emit, message_type=MessageType.INFO_MESSAGE)
+    show_success = partialmethod(_emit, message_type=MessageType.SUCCESS_MESSAGE)
 
     def confirm(self, question: str, default: bool = False) -> bool:
         """Ask for confirmation."""
         self.add_message(question, MessageType.CLAUDE_QUESTION)
-        self.clear_screen()
-        self.display()
+        self.refresh()
 
-        answer = questionary.confirm(question, default=default, style=self.qstyle).ask()
+        with self.external_output():
+            answer = self._questionary().confirm(question, default=default, style=self.qstyle).ask()
 
         self.add_message("Yes" if answer else "No", MessageType.USER_MESSAGE)
         return answer
@@ -224,25 +312,24 @@ class EnhancedTerminalUI:
         table.add_column("Key Features", style="dim")
 
         for module in modules:
-            features = "\n".join([f"{icons.BULLET} {f}" for f in module.get("key_features", [])])
+            features = "\n".join([f"{icons.BULLET} {f}" for f in module.get("key_features", ())])
             table.add_row(module["name"], module["description"], features)
 
         # Create a panel with the table
         panel = Panel(table, border_style="bright_black", box=MINIMAL, padding=(1, 2))
 
-        self.console.print(panel)
+        with self.external_output():
+            self.console.print(panel)
 
     def show_task_list(self, tasks: List[Dict[str, Any]]):
         """Display task list in a nice format."""
         # Group tasks by module
-        tasks_by_module = {}
+        tasks_by_module = defaultdict(list)
         for task in tasks:
-            module = task.get("module", "General")
-            if module not in tasks_by_module:
-                tasks_by_module[module] = []
-            tasks_by_module[module].append(task)
+            tasks_by_module[task.get("module", "General")].append(task)
 
         # Create panels for each module
+        self._painted_lines = None
         for module, module_tasks in tasks_by_module.items():
             table = Table(
                 title=f"{icons.TASK} {module} Tasks",
@@ -267,7 +354,7 @@ class EnhancedTerminalUI:
                 )
                 table.add_row(
                     task["title"],
-                    f"[{status_style}]{status}[/{status_style}]",
+                    Text.assemble((status, status_style)),
                 )
 
             panel = Panel(table, border_style="bright_black", box=MINIMAL, padding=(1, 2))
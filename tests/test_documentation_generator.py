@@ -111,6 +111,27 @@ class TestDocumentationGenerator:
         assert '- [ ] Complete task 1' in todo_content
         assert '- [ ] Complete task 2' in todo_content
     
+    @patch('pathlib.Path.write_text')
+    def test_create_todo_file_status_summary(self, mock_write):
+        """Test the TODO status summary is rendered for non-empty item lists."""
+        todos = [
+            "- [x] Complete task 1",
+            "- [ ] Complete task 2"
+        ]
+
+        self.doc_generator.create_todo_file(
+            self.test_project_path / 'TODO.md',
+            'TestProject',
+            'core module',
+            todos
+        )
+
+        mock_write.assert_called_once()
+        todo_content = mock_write.call_args[0][0]
+        assert '1/2 tasks completed (50%)' in todo_content
+        assert '- [x] Complete task 1' in todo_content
+        assert '- [ ] Complete task 2' in todo_content
+
     def test_generate_module_todos(self):
         """Test generating module-specific TODOs."""
         tasks = [